@@ -2,11 +2,6 @@
 
 import argparse
 
-import uvicorn
-
-from dedalus_labs_proxy.config import init_config
-from dedalus_labs_proxy.logging import setup_logging
-
 
 def main() -> None:
     """Main entry point for the dedalus-proxy CLI."""
@@ -29,7 +24,7 @@ def main() -> None:
     parser.add_argument(
         "--log-level",
         type=str,
-        choices=["debug", "info", "warning", "error"],
+        choices=["debug", "info", "warning", "error", "critical"],
         default="info",
         help="Log level (default: info)",
     )
@@ -41,6 +36,12 @@ def main() -> None:
 
     args = parser.parse_args()
 
+    # Deferred so --help and argument errors don't pay for the server imports
+    import uvicorn
+
+    from dedalus_labs_proxy.config import init_config
+    from dedalus_labs_proxy.logging import setup_logging
+
     # Initialize configuration (will exit if DEDALUS_API_KEY is missing)
     init_config(require_api_key=True)
 
@@ -56,6 +57,11 @@ def main() -> None:
         host=args.host,
         port=args.port,
         log_level=args.log_level,
+        # uvloop and httptools are picked automatically when installed
+        loop="auto",
+        http="auto",
+        # Requests are already logged by the app middleware
+        access_log=False,
     )
 
 
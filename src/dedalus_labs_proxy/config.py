@@ -2,44 +2,78 @@
 
 import os
 import sys
+from dataclasses import dataclass
 
 from dotenv import load_dotenv
 
-load_dotenv()
+_dotenv_loaded = False
 
 
+def _load_dotenv_once() -> None:
+    """Load the .env file into the environment on first use only."""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv(override=False)
+        _dotenv_loaded = True
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Application configuration loaded from environment variables."""
+    """Application configuration loaded from environment variables.
+
+    Instances are immutable; the environment is parsed once by ``from_env``
+    and the resulting values are shared by every caller of ``get_config``.
+    """
 
-    def __init__(self, require_api_key: bool = True) -> None:
-        """Initialize configuration from environment variables.
+    dedalus_api_key: str | None = None
+    host: str = "0.0.0.0"
+    port: int = 8000
+    dedalus_base_url: str = "https://api.dedaluslabs.ai"
+    log_level: str = "INFO"
+    max_tokens: int = 4096
+    temperature: float = 0.7
+    timeout: float = 300.0
+    max_retries: int = 2
+    stream_keepalive_interval: float = 15.0
+    # Default max tokens for tool-enabled requests (large to support file writes)
+    tool_max_tokens: int = 128000
+
+    @classmethod
+    def from_env(cls, require_api_key: bool = True) -> "Config":
+        """Build configuration from environment variables.
 
         Args:
             require_api_key: If True, exit if DEDALUS_API_KEY is not set.
+
+        Returns:
+            The parsed configuration.
         """
-        self.dedalus_api_key = os.getenv("DEDALUS_API_KEY")
-        if require_api_key and not self.dedalus_api_key:
+        _load_dotenv_once()
+        dedalus_api_key = os.getenv("DEDALUS_API_KEY")
+        if require_api_key and not dedalus_api_key:
             print(
                 "Error: DEDALUS_API_KEY environment variable is required",
                 file=sys.stderr,
             )
             sys.exit(1)
 
-        self.host = os.getenv("HOST", "0.0.0.0")
-        self.port = int(os.getenv("PORT", "8000"))
-        self.dedalus_base_url = os.getenv(
-            "DEDALUS_BASE_URL", "https://api.dedaluslabs.ai"
-        )
-        self.log_level = os.getenv("LOG_LEVEL", "INFO").upper()
-        self.max_tokens = int(os.getenv("MAX_TOKENS", "4096"))
-        self.temperature = float(os.getenv("DEFAULT_TEMPERATURE", "0.7"))
-        self.timeout = float(os.getenv("REQUEST_TIMEOUT", "300"))
-        self.max_retries = int(os.getenv("MAX_RETRIES", "2"))
-        self.stream_keepalive_interval = float(
-            os.getenv("STREAM_KEEPALIVE_INTERVAL", "15")
+        return cls(
+            dedalus_api_key=dedalus_api_key,
+            host=os.getenv("HOST", "0.0.0.0"),
+            port=int(os.getenv("PORT", "8000")),
+            dedalus_base_url=os.getenv(
+                "DEDALUS_BASE_URL", "https://api.dedaluslabs.ai"
+            ),
+            log_level=os.getenv("LOG_LEVEL", "INFO").upper(),
+            max_tokens=int(os.getenv("MAX_TOKENS", "4096")),
+            temperature=float(os.getenv("DEFAULT_TEMPERATURE", "0.7")),
+            timeout=float(os.getenv("REQUEST_TIMEOUT", "300")),
+            max_retries=int(os.getenv("MAX_RETRIES", "2")),
+            stream_keepalive_interval=float(
+                os.getenv("STREAM_KEEPALIVE_INTERVAL", "15")
+            ),
+            tool_max_tokens=int(os.getenv("TOOL_MAX_TOKENS", "128000")),
         )
-        # Default max tokens for tool-enabled requests (large to support file writes)
-        self.tool_max_tokens = int(os.getenv("TOOL_MAX_TOKENS", "128000"))
 
 
 # Global config instance - initialized lazily to allow testing
@@ -50,7 +84,7 @@ def get_config() -> Config:
     """Get the global configuration instance."""
     global _config
     if _config is None:
-        _config = Config()
+        _config = Config.from_env()
     return _config
 
 
@@ -64,5 +98,5 @@ def init_config(require_api_key: bool = True) -> Config:
         The configuration instance.
     """
     global _config
-    _config = Config(require_api_key=require_api_key)
+    _config = Config.from_env(require_api_key=require_api_key)
     return _config
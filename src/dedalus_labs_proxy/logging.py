@@ -2,24 +2,87 @@
 
 import json
 import logging
+import re
 import sys
+from collections.abc import Iterable
 from typing import Any
 
+import orjson
+
+# Supported log level names, as accepted by the --log-level CLI option
+LOG_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+# Timestamp format used by the JSON formatter
+JSON_DATEFMT = "%Y-%m-%dT%H:%M:%S"
+
+
+# Pre-serialized JSON fragments for the fixed log record shape. Only the
+# field values are encoded per record; keys and punctuation are constant.
+_JSON_TIMESTAMP = b'{"timestamp":'
+_JSON_LEVEL = b',"level":'
+_JSON_LOGGER = b',"logger":'
+_JSON_MESSAGE = b',"message":'
+_JSON_EXCEPTION = b',"exception":'
+_JSON_END = b"}"
+
+
+def _dumps_str(value: str) -> bytes:
+    """Encode a string as a JSON string.
+
+    orjson rejects strings holding lone surrogates, which client-supplied
+    text can contain; those fall back to ``json.dumps``, which escapes them.
+    """
+    try:
+        return orjson.dumps(value)
+    except orjson.JSONEncodeError:
+        return json.dumps(value).encode()
+
 
 class JSONFormatter(logging.Formatter):
     """JSON log formatter for structured logging."""
 
+    # (second, encoded timestamp) of the most recently formatted record
+    _timestamp_cache: tuple[int, bytes] = (-1, b"")
+
+    def _encoded_timestamp(self, record: logging.LogRecord) -> bytes:
+        """Return the record's timestamp as an encoded JSON string.
+
+        With an explicit ``datefmt`` the timestamp has one-second resolution,
+        so it is formatted once per second and reused for every record
+        logged within that second.
+        """
+        if self.datefmt is None:
+            return orjson.dumps(self.formatTime(record))
+        second = int(record.created)
+        cached_second, encoded = self._timestamp_cache
+        if second != cached_second:
+            encoded = orjson.dumps(self.formatTime(record, self.datefmt))
+            self._timestamp_cache = (second, encoded)
+        return encoded
+
     def format(self, record: logging.LogRecord) -> str:
         """Format a log record as JSON."""
-        log_obj = {
-            "timestamp": self.formatTime(record, self.datefmt),
-            "level": record.levelname,
-            "logger": record.name,
-            "message": record.getMessage(),
-        }
+        parts = [
+            _JSON_TIMESTAMP,
+            self._encoded_timestamp(record),
+            _JSON_LEVEL,
+            orjson.dumps(record.levelname),
+            _JSON_LOGGER,
+            _dumps_str(record.name),
+            _JSON_MESSAGE,
+            _dumps_str(record.getMessage()),
+        ]
         if record.exc_info:
-            log_obj["exception"] = self.formatException(record.exc_info)
-        return json.dumps(log_obj)
+            parts.append(_JSON_EXCEPTION)
+            parts.append(_dumps_str(self.formatException(record.exc_info)))
+        parts.append(_JSON_END)
+        return b"".join(parts).decode()
 
 
 def setup_logging(
@@ -29,24 +92,35 @@ def setup_logging(
     """Configure structured logging for the application.
 
     Args:
-        level: Log level (DEBUG, INFO, WARNING, ERROR).
+        level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL), in any case.
         json_output: If True, output logs as JSON.
 
     Returns:
         Configured logger instance.
+
+    Raises:
+        ValueError: If the level name is not recognized.
     """
+    try:
+        log_level = LOG_LEVELS[level.lower()]
+    except KeyError:
+        accepted = ", ".join(LOG_LEVELS)
+        raise ValueError(
+            f"Unknown log level {level!r}; expected one of: {accepted}"
+        ) from None
+
     logger = logging.getLogger("dedalus-proxy")
-    logger.setLevel(getattr(logging, level.upper()))
+    logger.setLevel(log_level)
 
     # Clear any existing handlers
     logger.handlers.clear()
 
     handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(getattr(logging, level.upper()))
+    handler.setLevel(log_level)
 
     formatter: logging.Formatter
     if json_output:
-        formatter = JSONFormatter(datefmt="%Y-%m-%dT%H:%M:%S")
+        formatter = JSONFormatter(datefmt=JSON_DATEFMT)
     else:
         formatter = logging.Formatter(
             "%(asctime)s | %(levelname)s | %(name)s | %(message)s",
@@ -59,6 +133,15 @@ def setup_logging(
     return logger
 
 
+# Field name fragments redacted by default
+DEFAULT_SENSITIVE_FIELDS = ("api_key", "password", "token", "authorization", "bearer")
+
+# Matches any default sensitive field, case-insensitively
+_SENSITIVE_RE = re.compile(
+    "|".join(map(re.escape, DEFAULT_SENSITIVE_FIELDS)), re.IGNORECASE
+)
+
+
 def sanitize_log_data(data: Any, sensitive_fields: list[str] | None = None) -> Any:
     """Remove sensitive data from logs.
 
@@ -70,7 +153,7 @@ def sanitize_log_data(data: Any, sensitive_fields: list[str] | None = None) -> A
         Sanitized data with sensitive values replaced by '[REDACTED]'.
     """
     if sensitive_fields is None:
-        sensitive_fields = ["api_key", "password", "token", "authorization", "bearer"]
+        sensitive_fields = list(DEFAULT_SENSITIVE_FIELDS)
 
     if isinstance(data, dict):
         return {
@@ -87,5 +170,26 @@ def sanitize_log_data(data: Any, sensitive_fields: list[str] | None = None) -> A
         return data
 
 
+def format_headers(raw_headers: Iterable[tuple[bytes, bytes]]) -> str:
+    """Format raw HTTP headers for logging, redacting sensitive values.
+
+    Decodes and checks each header in a single pass, without first building
+    an intermediate dict.
+
+    Args:
+        raw_headers: Raw (name, value) header pairs, e.g. ``request.headers.raw``.
+
+    Returns:
+        Comma-separated ``name=value`` pairs with sensitive values redacted.
+    """
+    search = _SENSITIVE_RE.search
+    parts = []
+    for raw_name, raw_value in raw_headers:
+        name = raw_name.decode("latin-1")
+        value = "[REDACTED]" if search(name) else raw_value.decode("latin-1")
+        parts.append(f"{name}={value}")
+    return ", ".join(parts)
+
+
 # Default logger - will be reconfigured when CLI runs
 logger = logging.getLogger("dedalus-proxy")
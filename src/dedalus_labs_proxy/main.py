@@ -1,86 +1,106 @@
 """FastAPI application for Dedalus Labs Proxy."""
 
+import logging
 import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
+import orjson
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
-from dedalus_labs_proxy.logging import logger, sanitize_log_data
+from dedalus_labs_proxy.logging import format_headers, logger
+from dedalus_labs_proxy.middleware import WildcardCORSMiddleware
+from dedalus_labs_proxy.responses import ORJSONResponse
 from dedalus_labs_proxy.routes import chat_router, health_router, models_router
+from dedalus_labs_proxy.services.dedalus import global_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Open the Dedalus client at startup and close it at shutdown."""
+    global_client.start()
+    try:
+        yield
+    finally:
+        await global_client.close()
+
 
 app = FastAPI(
     title="Dedalus Labs Proxy",
     description="OpenAI-compatible proxy for Dedalus Labs API",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=False,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(WildcardCORSMiddleware)
 
 
 @app.middleware("http")
 async def log_requests_responses(request: Request, call_next: Any) -> Any:
     """Log incoming requests and outgoing responses."""
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
 
-    logger.info(
-        "Request: %s %s | Headers: %s",
-        request.method,
-        request.url.path,
-        sanitize_log_data(dict(request.headers)),
-    )
+    method = request.method
+    path = request.url.path
+    logger.info("Request: %s %s", method, path)
+    # Header sanitization walks every header, so only do it when it will be logged
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Headers: %s", format_headers(request.headers.raw))
 
     try:
         response = await call_next(request)
     except Exception as e:
-        logger.error("Request failed: %s | Error: %s", request.url.path, str(e))
+        logger.error("Request failed: %s | Error: %s", path, str(e))
         raise
 
-    process_time = (time.time() - start_time) * 1000
+    elapsed_us = (time.perf_counter_ns() - start_ns) // 1000
     logger.info(
-        "Response: %s %s | Status: %d | Time: %.2fms",
-        request.method,
-        request.url.path,
+        "Response: %s %s | Status: %d | Time: %d.%03dms",
+        method,
+        path,
         response.status_code,
-        process_time,
+        elapsed_us // 1000,
+        elapsed_us % 1000,
     )
 
     return response
 
 
+# Error body for unhandled exceptions, serialized once at import
+_INTERNAL_ERROR_BODY = orjson.dumps(
+    {"error": {"message": "Internal server error", "type": "internal_error"}}
+)
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> Response:
     """Handle validation errors with OpenAI-compatible error format."""
+    errors = exc.errors()
     logger.warning(
         "Validation error on %s %s: %s",
         request.method,
         request.url.path,
-        str(exc.errors()),
+        str(errors),
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={
             "error": {
                 "message": "Invalid request data",
                 "type": "validation_error",
-                "details": exc.errors(),
+                "details": errors,
             }
         },
     )
 
 
 @app.exception_handler(HTTPException)
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> Response:
     """Handle HTTP exceptions with OpenAI-compatible error format."""
     error_type = "http_error"
     if exc.status_code == 401:
@@ -93,19 +113,14 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
         exc.status_code,
         exc.detail,
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
-        content={
-            "error": {
-                "message": str(exc.detail),
-                "type": error_type,
-            }
-        },
+        content={"error": {"message": str(exc.detail), "type": error_type}},
     )
 
 
 @app.exception_handler(Exception)
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> Response:
     """Handle unexpected exceptions."""
     logger.error(
         "Unhandled exception on %s %s: %s",
@@ -114,14 +129,10 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
         str(exc),
         exc_info=True,
     )
-    return JSONResponse(
+    return Response(
+        content=_INTERNAL_ERROR_BODY,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": {
-                "message": "Internal server error",
-                "type": "internal_error",
-            }
-        },
+        media_type="application/json",
     )
 
 
@@ -0,0 +1,130 @@
+"""ASGI middleware for Dedalus Labs Proxy."""
+
+from collections.abc import Iterable
+
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# HTTP methods accepted in CORS preflight requests
+ALLOWED_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT", "QUERY")
+
+# Pre-encoded CORS response headers
+_ALLOW_ORIGIN_HEADER = (b"access-control-allow-origin", b"*")
+_VARY_ORIGIN_HEADER = (b"vary", b"Origin")
+
+_PREFLIGHT_HEADERS = {
+    "Vary": "Origin, Access-Control-Request-Method, Access-Control-Request-Headers, "
+    "Access-Control-Request-Private-Network",
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": ", ".join(ALLOWED_METHODS),
+    "Access-Control-Max-Age": "600",
+}
+
+
+def _add_cors_headers(
+    headers: Iterable[tuple[bytes, bytes]], has_origin: bool
+) -> list[tuple[bytes, bytes]]:
+    """Return response headers with the CORS allow-origin and Vary headers added."""
+    result = list(headers)
+    if has_origin:
+        result.append(_ALLOW_ORIGIN_HEADER)
+    vary = [value for name, value in result if name == b"vary"]
+    if vary:
+        result = [(name, value) for name, value in result if name != b"vary"]
+        result.append((b"vary", b", ".join([*vary, b"Origin"])))
+    else:
+        result.append(_VARY_ORIGIN_HEADER)
+    return result
+
+
+class WildcardCORSMiddleware:
+    """CORS middleware that allows any origin, method and header.
+
+    Equivalent to Starlette's ``CORSMiddleware`` configured with
+    ``allow_origins=["*"]``, ``allow_methods=["*"]``, ``allow_headers=["*"]``
+    and ``allow_credentials=False``, but with all response headers fixed at
+    import time. Requests are handled with a single scan of the raw header
+    list instead of per-request origin matching and header-dict wrappers.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The ASGI application to wrap.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        requested_method = None
+        requested_headers = None
+        requested_private_network = False
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value if origin is None else origin
+            elif name == b"access-control-request-method":
+                requested_method = (
+                    value if requested_method is None else requested_method
+                )
+            elif name == b"access-control-request-headers":
+                requested_headers = (
+                    value if requested_headers is None else requested_headers
+                )
+            elif name == b"access-control-request-private-network":
+                requested_private_network = True
+
+        if (
+            origin is not None
+            and requested_method is not None
+            and scope["method"] == "OPTIONS"
+        ):
+            response = self._preflight_response(
+                requested_method, requested_headers, requested_private_network
+            )
+            await response(scope, receive, send)
+            return
+
+        has_origin = origin is not None
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = _add_cors_headers(
+                    message.get("headers", ()), has_origin
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    @staticmethod
+    def _preflight_response(
+        requested_method: bytes,
+        requested_headers: bytes | None,
+        requested_private_network: bool,
+    ) -> PlainTextResponse:
+        """Build the response to a CORS preflight request."""
+        headers = dict(_PREFLIGHT_HEADERS)
+        # All headers are allowed, so mirror back whatever was requested
+        if requested_headers is not None:
+            headers["Access-Control-Allow-Headers"] = requested_headers.decode(
+                "latin-1"
+            )
+
+        failures = []
+        if requested_method.decode("latin-1") not in ALLOWED_METHODS:
+            failures.append("method")
+        if requested_private_network:
+            failures.append("private-network")
+
+        if failures:
+            return PlainTextResponse(
+                "Disallowed CORS " + ", ".join(failures),
+                status_code=400,
+                headers=headers,
+            )
+        return PlainTextResponse("OK", status_code=200, headers=headers)
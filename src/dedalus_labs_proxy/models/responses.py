@@ -1,9 +1,13 @@
 """Pydantic models for API responses."""
 
-from typing import Any
+from typing import Any, Final, Literal
 
 from pydantic import BaseModel
 
+# Values of the constant "object" field on completion responses
+CHAT_COMPLETION_OBJECT: Final = "chat.completion"
+CHAT_COMPLETION_CHUNK_OBJECT: Final = "chat.completion.chunk"
+
 
 class FunctionCall(BaseModel):
     """Function call in a tool call."""
@@ -59,7 +63,7 @@ class ChatCompletionResponse(BaseModel):
     """Non-streaming chat completion response."""
 
     id: str
-    object: str = "chat.completion"
+    object: Literal["chat.completion"] = CHAT_COMPLETION_OBJECT
     created: int
     model: str
     choices: list[ChatCompletionResponseChoice]
@@ -83,10 +87,14 @@ class ChatCompletionChunkChoice(BaseModel):
 
 
 class ChatCompletionChunk(BaseModel):
-    """Streaming chat completion chunk."""
+    """Streaming chat completion chunk.
+
+    All chunks of one completion share the same ``id`` and ``created``
+    timestamp, so both are computed once per stream rather than per chunk.
+    """
 
     id: str
-    object: str = "chat.completion.chunk"
+    object: Literal["chat.completion.chunk"] = CHAT_COMPLETION_CHUNK_OBJECT
     created: int
     model: str
     choices: list[ChatCompletionChunkChoice]
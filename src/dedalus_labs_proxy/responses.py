@@ -0,0 +1,26 @@
+"""HTTP response classes for Dedalus Labs Proxy."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    FastAPI's bundled ``ORJSONResponse`` is deprecated, so the proxy keeps its
+    own. Values orjson cannot encode natively (such as exceptions in
+    validation error contexts) are rendered with ``str``.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Serialize content to JSON bytes.
+
+        Args:
+            content: The JSON-compatible content to serialize.
+
+        Returns:
+            The encoded JSON body.
+        """
+        return orjson.dumps(content, default=str)
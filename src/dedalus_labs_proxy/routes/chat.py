@@ -1,31 +1,32 @@
 """Chat completions endpoint."""
 
 import asyncio
+import functools
+import logging
+import secrets
 import time
-import uuid
 from collections.abc import AsyncGenerator
-from typing import Any, cast
+from typing import Any
 
 import dedalus_labs
 import orjson
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
 from dedalus_labs_proxy.config import get_config
 from dedalus_labs_proxy.logging import logger
-from dedalus_labs_proxy.models.requests import ChatCompletionRequest, ToolChoiceObject
+from dedalus_labs_proxy.models.requests import (
+    ChatCompletionRequest,
+    ChatMessage,
+    Tool,
+    ToolChoiceObject,
+)
 from dedalus_labs_proxy.models.responses import (
-    ChatCompletionChunk,
-    ChatCompletionChunkChoice,
-    ChatCompletionChunkDelta,
-    ChatCompletionResponse,
-    ChatCompletionResponseChoice,
-    ChatCompletionUsage,
-    ChatMessageResponse,
-    FunctionCall,
-    ToolCall,
-    ToolCallDelta,
+    CHAT_COMPLETION_CHUNK_OBJECT,
+    CHAT_COMPLETION_OBJECT,
 )
+from dedalus_labs_proxy.responses import ORJSONResponse
 from dedalus_labs_proxy.services.dedalus import global_client
 
 router = APIRouter()
@@ -38,81 +39,242 @@ SSE_HEADERS = {
     "Transfer-Encoding": "chunked",
 }
 
+# Static SSE frames: end-of-stream sentinel and keepalive comment
+_DONE_SSE = b"data: [DONE]\n\n"
+_PING_SSE = b": ping\n\n"
+
+# Dump whole message and tool lists in one pydantic-core call instead of
+# one model_dump call per item
+_MESSAGE_LIST_ADAPTER = TypeAdapter(list[ChatMessage])
+_TOOL_LIST_ADAPTER = TypeAdapter(list[Tool])
+
+
+def _tool_call_delta(
+    index: int,
+    id: str | None = None,
+    type: str | None = None,
+    function: dict[str, Any] | None = None,
+    thought_signature: str | None = None,
+) -> dict[str, Any]:
+    """Build a streaming tool call delta as a plain dict.
+
+    Mirrors ``ToolCallDelta.model_dump(exclude_none=True)`` without
+    constructing a Pydantic model per delta.
+
+    Args:
+        index: Position of the tool call in the message.
+        id: Tool call ID.
+        type: Tool call type.
+        function: Function name and argument fragments.
+        thought_signature: Google thought signature, if any.
+
+    Returns:
+        The tool call delta with None values omitted.
+    """
+    tc_delta: dict[str, Any] = {"index": index}
+    if id is not None:
+        tc_delta["id"] = id
+    if type is not None:
+        tc_delta["type"] = type
+    if function is not None:
+        tc_delta["function"] = function
+    if thought_signature is not None:
+        tc_delta["thought_signature"] = thought_signature
+    return tc_delta
+
+
+# Closing bytes of a streaming chunk frame, following the delta or finish_reason
+_CHUNK_FRAME_END = b"}]}\n\n"
+
+
+def _chunk_prefix(completion_id: str, created: int, model: str) -> bytes:
+    """Pre-encode the start of the SSE frame shared by every chunk of a stream.
+
+    Chunks only differ in their delta and finish_reason, so the id, object,
+    created and model fields are serialized once per stream.
+
+    Args:
+        completion_id: ID shared by all chunks of the completion.
+        created: Creation timestamp shared by all chunks of the completion.
+        model: Model name to report.
+
+    Returns:
+        The frame up to and including the ``"delta":`` key.
+    """
+    encoded = orjson.dumps(
+        {
+            "id": completion_id,
+            "object": CHAT_COMPLETION_CHUNK_OBJECT,
+            "created": created,
+            "model": model,
+            "choices": [{"index": 0, "delta": None}],
+        }
+    )
+    return b"data: " + encoded[: -len(b"null}]}")]
+
+
+def _sse_chunk(
+    prefix: bytes, delta: dict[str, Any], finish_reason: str | None = None
+) -> bytes:
+    """Encode a streaming chat completion chunk as an SSE frame.
+
+    Produces the same bytes as ``ChatCompletionChunk.model_dump(exclude_none=True)``
+    encoded with orjson, without rebuilding the invariant fields per chunk.
+
+    Args:
+        prefix: Frame prefix from ``_chunk_prefix``.
+        delta: Delta fields for the chunk, with None values already omitted.
+        finish_reason: Finish reason, if this is the final chunk.
+
+    Returns:
+        The encoded ``data:`` frame.
+    """
+    if finish_reason is None:
+        return prefix + orjson.dumps(delta) + _CHUNK_FRAME_END
+    return (
+        prefix
+        + orjson.dumps(delta)
+        + b',"finish_reason":'
+        + orjson.dumps(finish_reason)
+        + _CHUNK_FRAME_END
+    )
+
+
+def _sse(payload: dict[str, Any]) -> bytes:
+    """Encode a payload as a Server-Sent Events data frame.
+
+    Args:
+        payload: The JSON-serializable event payload.
+
+    Returns:
+        The encoded ``data:`` frame.
+    """
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
+# SSE error frames for API failures whose message never varies
+_AUTH_ERROR_SSE = _sse({"error": {"message": "Authentication failed: Invalid API key"}})
+_TIMEOUT_ERROR_SSE = _sse(
+    {
+        "error": {
+            "message": "Request timed out. Try reducing the complexity of your query."
+        }
+    }
+)
+
+
+def _stream_error_sse(
+    exc: dedalus_labs.APIConnectionError | dedalus_labs.APIStatusError,
+    model: str,
+    context: str,
+) -> bytes:
+    """Log a Dedalus API error raised while streaming and encode it for the client.
+
+    Args:
+        exc: The API error.
+        model: The requested model name.
+        context: Description of the streaming path, used in log messages.
+
+    Returns:
+        The SSE error frame.
+    """
+    # Subclasses first: AuthenticationError is an APIStatusError and
+    # APITimeoutError is an APIConnectionError
+    if isinstance(exc, dedalus_labs.AuthenticationError):
+        logger.error("Authentication failed during %s for model: %s", context, model)
+        return _AUTH_ERROR_SSE
+    if isinstance(exc, dedalus_labs.APITimeoutError):
+        logger.error("Request timed out during %s: %s", context, str(exc))
+        return _TIMEOUT_ERROR_SSE
+    if isinstance(exc, dedalus_labs.APIConnectionError):
+        logger.error("Connection failed during %s: %s", context, str(exc))
+        return _sse(
+            {"error": {"message": f"Failed to connect to Dedalus API: {str(exc)}"}}
+        )
+    logger.error(
+        "API error during %s (status %d): %s", context, exc.status_code, exc.message
+    )
+    return _sse({"error": {"message": exc.message, "code": str(exc.status_code)}})
+
+
+def _tool_call_deltas(
+    delta_tool_calls: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Build tool call deltas from the raw tool calls of a streaming delta.
+
+    Args:
+        delta_tool_calls: The ``tool_calls`` list of a decoded chunk delta.
+
+    Returns:
+        One tool call delta per entry, with empty values omitted.
+    """
+    tool_calls = []
+    for tc in delta_tool_calls:
+        function = tc.get("function")
+        tool_calls.append(
+            _tool_call_delta(
+                index=tc.get("index", 0),
+                id=tc.get("id"),
+                type=tc.get("type"),
+                function=(
+                    {
+                        "name": function.get("name") or None,
+                        "arguments": function.get("arguments") or None,
+                    }
+                    if function
+                    else None
+                ),
+                thought_signature=tc.get("thought_signature") or None,
+            )
+        )
+    return tool_calls
+
 
-def _extract_delta(  # noqa: C901
-    chunk: Any,
-) -> tuple[str | None, str | None, list[ToolCallDelta] | None, str | None]:
+def _extract_delta(
+    chunk: dict[str, Any],
+) -> tuple[str | None, str | None, list[dict[str, Any]] | None, str | None]:
     """Extract delta information from a streaming chunk.
 
     Args:
-        chunk: The streaming chunk from the Dedalus API.
+        chunk: The streaming chunk from the Dedalus API, decoded as a dict
+            (streamed with ``raw=True``).
 
     Returns:
         Tuple of (role, content, tool_calls, finish_reason).
     """
-    role = None
-    delta_content = None
+    choices = chunk.get("choices")
+    if not choices:
+        return None, None, None, None
+
+    choice = choices[0]
     tool_calls = None
-    finish_reason = None
-
-    # Safety check for empty choices
-    if not chunk.choices:
-        return role, delta_content, tool_calls, finish_reason
-
-    choice = chunk.choices[0]
-
-    if hasattr(choice, "delta"):
-        delta = choice.delta
-
-        if hasattr(delta, "role") and delta.role:
-            role = str(delta.role)
-
-        if hasattr(delta, "content") and delta.content:
-            delta_content = str(delta.content)
-
-        if hasattr(delta, "tool_calls") and delta.tool_calls:
-            tool_calls = []
-            for tc in delta.tool_calls:
-                thought_signature = None
-                if hasattr(tc, "thought_signature") and tc.thought_signature:
-                    thought_signature = tc.thought_signature
-
-                tc_delta = ToolCallDelta(
-                    index=tc.index if hasattr(tc, "index") else 0,
-                    id=tc.id if hasattr(tc, "id") else None,
-                    type=tc.type if hasattr(tc, "type") else None,
-                    function=(
-                        {
-                            "name": (
-                                tc.function.name
-                                if hasattr(tc.function, "name") and tc.function.name
-                                else None
-                            ),
-                            "arguments": (
-                                tc.function.arguments
-                                if hasattr(tc.function, "arguments")
-                                and tc.function.arguments
-                                else None
-                            ),
-                        }
-                        if hasattr(tc, "function") and tc.function
-                        else None
-                    ),
-                    thought_signature=thought_signature,
-                )
-                tool_calls.append(tc_delta)
 
-    elif hasattr(choice, "message"):
-        message = choice.message
-        if hasattr(message, "role") and message.role:
-            role = str(message.role)
-        if hasattr(message, "content") and message.content:
-            delta_content = str(message.content)
+    if "delta" in choice:
+        message = choice["delta"] or {}
+        delta_tool_calls = message.get("tool_calls")
+        if delta_tool_calls:
+            tool_calls = _tool_call_deltas(delta_tool_calls)
+    else:
+        message = choice.get("message") or {}
+
+    role = message.get("role")
+    delta_content = message.get("content")
+    finish_reason = choice.get("finish_reason")
+
+    return (
+        str(role) if role else None,
+        str(delta_content) if delta_content else None,
+        tool_calls,
+        str(finish_reason) if finish_reason else None,
+    )
 
-    if hasattr(choice, "finish_reason") and choice.finish_reason:
-        finish_reason = str(choice.finish_reason)
 
-    return role, delta_content, tool_calls, finish_reason
+# Dedalus tool_choice for each OpenAI string value. Shared across requests,
+# so the dicts must not be mutated.
+_TOOL_CHOICE_BY_NAME: dict[str, dict[str, Any]] = {
+    "none": {"type": "none"},
+    "required": {"type": "any"},
+}
 
 
 def _serialize_tool_choice(
@@ -130,35 +292,16 @@ def _serialize_tool_choice(
         return None
 
     if isinstance(tool_choice, str):
-        if tool_choice == "auto":
-            return None
-        elif tool_choice == "none":
-            return {"type": "none"}
-        elif tool_choice == "required":
-            return {"type": "any"}
-        else:
-            return None
+        # "auto" and unknown strings map to None (the API default)
+        return _TOOL_CHOICE_BY_NAME.get(tool_choice)
 
     return tool_choice.model_dump()
 
 
-def _sanitize_tool_schema(schema: dict[str, Any]) -> dict[str, Any]:
-    """Remove or transform fields from tool schema for Google API compatibility.
-
-    Google's API rejects schemas with $schema, additionalProperties, and other
-    JSON Schema draft fields that OpenAI accepts. It also has issues with
-    numeric constraint fields (like maxLength) - the Dedalus SDK may coerce
-    string values back to integers, so we remove these fields entirely.
-
-    Args:
-        schema: The schema dict to sanitize.
-
-    Returns:
-        Sanitized schema dict.
-    """
-    # JSON Schema keywords that Google API doesn't accept
-    # These are schema-level keywords, NOT property names
-    disallowed_schema_keywords = {
+# JSON Schema keywords that Google API doesn't accept
+# These are schema-level keywords, NOT property names
+_DISALLOWED_SCHEMA_KEYWORDS = frozenset(
+    {
         "$schema",
         "additionalProperties",
         # Numeric constraints that cause issues with Google API via Dedalus SDK
@@ -172,35 +315,117 @@ def _sanitize_tool_schema(schema: dict[str, Any]) -> dict[str, Any]:
         "exclusiveMaximum",
         "multipleOf",
     }
+)
 
-    def _clean_dict(
-        d: dict[str, Any], is_properties_dict: bool = False
-    ) -> dict[str, Any]:
-        cleaned: dict[str, Any] = {}
-        for key, value in d.items():
-            # Only skip disallowed keywords when NOT inside a "properties" dict
-            # This ensures we don't accidentally remove user-defined property names
-            # that happen to match JSON Schema keywords
-            if not is_properties_dict and key in disallowed_schema_keywords:
-                continue
-            if isinstance(value, dict):
-                # If this key is "properties", mark the next level as a properties dict
-                cleaned[key] = _clean_dict(
-                    value, is_properties_dict=(key == "properties")
-                )
-            elif isinstance(value, list):
-                cleaned_list: list[Any] = []
-                for item in value:
-                    if isinstance(item, dict):
-                        cleaned_list.append(_clean_dict(item, is_properties_dict=False))
-                    else:
-                        cleaned_list.append(item)
-                cleaned[key] = cleaned_list
-            else:
-                cleaned[key] = value
-        return cleaned
 
-    return _clean_dict(schema)
+def _copy_until(d: dict[str, Any], stop_key: str) -> dict[str, Any]:
+    """Shallow-copy the entries of a dict that precede ``stop_key``."""
+    copied: dict[str, Any] = {}
+    for key, value in d.items():
+        if key == stop_key:
+            break
+        copied[key] = value
+    return copied
+
+
+def _clean_schema_dict(d: dict[str, Any], is_properties_dict: bool) -> dict[str, Any]:
+    """Drop disallowed keywords from a schema dict, copying only on change."""
+    # ``cleaned`` stays None until a key is dropped or a nested value changes,
+    # so untouched subtrees are returned as-is
+    cleaned: dict[str, Any] | None = None
+    for key, value in d.items():
+        # Only skip disallowed keywords when NOT inside a "properties" dict
+        # This ensures we don't accidentally remove user-defined property names
+        # that happen to match JSON Schema keywords
+        if not is_properties_dict and key in _DISALLOWED_SCHEMA_KEYWORDS:
+            if cleaned is None:
+                cleaned = _copy_until(d, key)
+            continue
+        if isinstance(value, dict):
+            # If this key is "properties", mark the next level as a properties dict
+            new_value: Any = _clean_schema_dict(value, key == "properties")
+        elif isinstance(value, list):
+            new_value = _clean_schema_list(value)
+        else:
+            new_value = value
+        if cleaned is not None:
+            cleaned[key] = new_value
+        elif new_value is not value:
+            cleaned = _copy_until(d, key)
+            cleaned[key] = new_value
+    return d if cleaned is None else cleaned
+
+
+def _clean_schema_list(items: list[Any]) -> list[Any]:
+    """Clean the dict items of a schema list, copying only on change."""
+    cleaned: list[Any] | None = None
+    for i, item in enumerate(items):
+        new_item = _clean_schema_dict(item, False) if isinstance(item, dict) else item
+        if cleaned is not None:
+            cleaned.append(new_item)
+        elif new_item is not item:
+            cleaned = items[:i]
+            cleaned.append(new_item)
+    return items if cleaned is None else cleaned
+
+
+def _sanitize_tool_schema(schema: dict[str, Any]) -> dict[str, Any]:
+    """Remove or transform fields from tool schema for Google API compatibility.
+
+    Google's API rejects schemas with $schema, additionalProperties, and other
+    JSON Schema draft fields that OpenAI accepts. It also has issues with
+    numeric constraint fields (like maxLength) - the Dedalus SDK may coerce
+    string values back to integers, so we remove these fields entirely.
+
+    Args:
+        schema: The schema dict to sanitize.
+
+    Returns:
+        Sanitized schema dict. Parts of the schema that need no changes are
+        shared with the input rather than copied.
+    """
+    return _clean_schema_dict(schema, False)
+
+
+def _sanitize_tool(tool: dict[str, Any]) -> dict[str, Any]:
+    """Sanitize a single tool definition for Google API compatibility.
+
+    Args:
+        tool: The tool definition.
+
+    Returns:
+        The tool with its parameters schema sanitized, or the input tool
+        itself when its schema contains nothing to remove.
+    """
+    function = tool.get("function")
+    if not function or "parameters" not in function:
+        return tool
+    original_params = function["parameters"]
+    sanitized_params = _sanitize_tool_schema(original_params)
+    if sanitized_params is original_params:
+        return tool
+    logger.debug("Sanitized tool %s parameters", function.get("name", "unknown"))
+    return {**tool, "function": {**function, "parameters": sanitized_params}}
+
+
+@functools.lru_cache(maxsize=512)
+def _sanitize_tool_json(tool_json: bytes) -> bytes | None:
+    """Sanitize a JSON-encoded tool definition, memoized on its encoding.
+
+    Agent loops resend the same tools on every turn, so repeated definitions
+    are served from the cache. Keys are not sorted when encoding because
+    property order in the schema is meaningful to the model.
+
+    Args:
+        tool_json: The orjson-encoded tool definition.
+
+    Returns:
+        The orjson-encoded sanitized tool definition, or None if the tool is
+        already Google-compatible.
+    """
+    tool = orjson.loads(tool_json)
+    sanitized = _sanitize_tool(tool)
+    return None if sanitized is tool else orjson.dumps(sanitized)
 
 
 def _sanitize_tools_for_google(tools: list[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -210,22 +435,21 @@ def _sanitize_tools_for_google(tools: list[dict[str, Any]]) -> list[dict[str, An
         tools: List of tool definitions.
 
     Returns:
-        Sanitized tool definitions.
+        Sanitized tool definitions. Tools that need no changes are passed
+        through as-is; sanitized ones are freshly decoded, so callers may
+        mutate them without affecting the cache.
     """
     sanitized = []
     for tool in tools:
-        tool_copy = tool.copy()
-        if "function" in tool_copy and "parameters" in tool_copy["function"]:
-            tool_copy["function"] = tool_copy["function"].copy()
-            original_params = tool_copy["function"]["parameters"]
-            sanitized_params = _sanitize_tool_schema(original_params)
-            tool_copy["function"]["parameters"] = sanitized_params
-            # Debug: log if we found any maxLength fields
-            logger.debug(
-                "Sanitized tool %s parameters",
-                tool_copy["function"].get("name", "unknown"),
-            )
-        sanitized.append(tool_copy)
+        try:
+            tool_json = orjson.dumps(tool)
+        except (orjson.JSONEncodeError, TypeError):
+            # orjson rejects some valid JSON, such as integers beyond 64 bits;
+            # sanitize those tools without the cache
+            sanitized.append(_sanitize_tool(tool))
+            continue
+        cleaned = _sanitize_tool_json(tool_json)
+        sanitized.append(tool if cleaned is None else orjson.loads(cleaned))
     return sanitized
 
 
@@ -238,7 +462,7 @@ def _is_google_model(model: str) -> bool:
     Returns:
         True if the model is a Google model.
     """
-    return model.startswith("google/") or model.startswith("gemini")
+    return model.startswith(("google/", "gemini"))
 
 
 def _inject_thought_signatures(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -258,30 +482,72 @@ def _inject_thought_signatures(messages: list[dict[str, Any]]) -> list[dict[str,
     """
     result = []
     for msg in messages:
-        if msg.get("role") == "assistant" and msg.get("tool_calls"):
-            msg = msg.copy()
-            tool_calls = []
-            for idx, tc in enumerate(msg["tool_calls"]):
-                tc = tc.copy()
-                if not tc.get("thought_signature"):
-                    if idx == 0:
-                        # Google-approved magic string to skip signature validation
-                        # See: https://ai.google.dev/gemini-api/docs/thought-signatures#faqs
-                        # Base64-encoded because Dedalus SDK expects encoded signatures
-                        # b64encode(b"skip_thought_signature_validator")
-                        tc["thought_signature"] = (
-                            "c2tpcF90aG91Z2h0X3NpZ25hdHVyZV92YWxpZGF0b3I="
-                        )
-                        logger.debug(
-                            "Injected dummy thought_signature for tool call %s",
-                            tc.get("function", {}).get("name", "unknown"),
-                        )
-                tool_calls.append(tc)
-            msg["tool_calls"] = tool_calls
+        tool_calls = msg.get("tool_calls") if msg.get("role") == "assistant" else None
+        # Only the first tool call of a message needs a signature, and messages
+        # are only copied when one is actually missing
+        if tool_calls and not tool_calls[0].get("thought_signature"):
+            first = tool_calls[0].copy()
+            # Google-approved magic string to skip signature validation
+            # See: https://ai.google.dev/gemini-api/docs/thought-signatures#faqs
+            # Base64-encoded because Dedalus SDK expects encoded signatures
+            # b64encode(b"skip_thought_signature_validator")
+            first["thought_signature"] = "c2tpcF90aG91Z2h0X3NpZ25hdHVyZV92YWxpZGF0b3I="
+            logger.debug(
+                "Injected dummy thought_signature for tool call %s",
+                first.get("function", {}).get("name", "unknown"),
+            )
+            msg = {**msg, "tool_calls": [first, *tool_calls[1:]]}
         result.append(msg)
     return result
 
 
+def _build_completion_kwargs(
+    request: ChatCompletionRequest, stream: bool, for_google: bool
+) -> dict[str, Any]:
+    """Build the DedalusRunner.create_completion arguments for a request.
+
+    Args:
+        request: The chat completion request.
+        stream: Whether to request a streaming response.
+        for_google: Whether to apply the Google-specific message and tool
+            fixups.
+
+    Returns:
+        Keyword arguments for ``create_completion``.
+    """
+    messages = _MESSAGE_LIST_ADAPTER.dump_python(request.messages, exclude_none=True)
+    tools = (
+        _TOOL_LIST_ADAPTER.dump_python(request.tools, exclude_none=True)
+        if request.tools
+        else None
+    )
+
+    if for_google:
+        # Inject thought_signature for Google models (required for Gemini 3)
+        messages = _inject_thought_signatures(messages)
+
+        # Sanitize tools for Google API compatibility
+        if tools:
+            logger.debug("Sanitizing %d tools for Google API", len(tools))
+            tools = _sanitize_tools_for_google(tools)
+
+    return {
+        "model": request.model,
+        "messages": messages,
+        "stream": stream,
+        "temperature": request.temperature,
+        "max_tokens": request.max_tokens,
+        "max_completion_tokens": request.max_completion_tokens,
+        "top_p": request.top_p,
+        "stop": request.stop,
+        "tools": tools,
+        "tool_choice": _serialize_tool_choice(request.tool_choice),
+        "parallel_tool_calls": request.parallel_tool_calls,
+        "reasoning_effort": request.reasoning_effort,
+        "verbosity": request.verbosity,
+    }
+
+
 async def _iter_with_keepalive(
     stream: Any,
     keepalive_interval: float,
@@ -300,36 +566,34 @@ async def _iter_with_keepalive(
         Items from the stream, or None to indicate a keepalive ping should be sent.
     """
     stream_iter = stream.__aiter__()
-    # Track the pending __anext__ task to avoid cancellation issues
+    # Track the pending __anext__ task; asyncio.wait never cancels it on timeout
     pending_next: asyncio.Task[Any] | None = None
 
     while True:
+        # Create task for next item if we don't have one pending
+        if pending_next is None:
+            pending_next = asyncio.create_task(stream_iter.__anext__())
+
+        done, _ = await asyncio.wait({pending_next}, timeout=keepalive_interval)
+        if not done:
+            # Task still pending - yield None to signal keepalive ping
+            yield None
+            # Continue loop to wait for the same task again
+            continue
+
+        task, pending_next = pending_next, None  # Task completed, clear it
         try:
-            # Create task for next item if we don't have one pending
-            if pending_next is None:
-                pending_next = asyncio.create_task(stream_iter.__anext__())
-
-            # Wait for the next chunk with a timeout, but don't cancel the task
-            try:
-                chunk = await asyncio.wait_for(
-                    asyncio.shield(pending_next),
-                    timeout=keepalive_interval,
-                )
-                pending_next = None  # Task completed, clear it
-                yield chunk
-            except TimeoutError:
-                # Task still pending - yield None to signal keepalive ping
-                yield None
-                # Continue loop to wait for the same task again
+            chunk = task.result()
         except StopAsyncIteration:
             # Stream exhausted
             break
+        yield chunk
 
 
 async def _stream_google_with_tools(
     request: ChatCompletionRequest,
     config: Any,
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     """Handle streaming for Google models with tools by falling back to non-streaming.
 
     Google models via Dedalus API don't properly support streaming with function calling.
@@ -342,7 +606,7 @@ async def _stream_google_with_tools(
     Yields:
         SSE-formatted chunks that simulate streaming.
     """
-    completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+    completion_id = f"chatcmpl-{secrets.token_hex(12)}"
     created = int(time.time())
     dedalus_model = request.model
     keepalive_interval = config.stream_keepalive_interval
@@ -353,53 +617,21 @@ async def _stream_google_with_tools(
     )
 
     try:
-        messages = [msg.model_dump(exclude_none=True) for msg in request.messages]
-
-        # Inject thought_signature for Google models (required for Gemini 3)
-        messages = _inject_thought_signatures(messages)
-
-        tools = (
-            [tool.model_dump(exclude_none=True) for tool in request.tools]
-            if request.tools
-            else None
-        )
-
-        # Sanitize tools for Google API compatibility
-        if tools:
-            logger.debug("Sanitizing %d tools for Google API", len(tools))
-            tools = _sanitize_tools_for_google(tools)
+        kwargs = _build_completion_kwargs(request, stream=False, for_google=True)
 
         # Create the API call as a task so we can send keepalive pings while waiting
-        api_task = asyncio.create_task(
-            global_client.runner.create_completion(
-                model=dedalus_model,
-                messages=messages,
-                stream=False,
-                temperature=request.temperature,
-                max_tokens=request.max_tokens,
-                max_completion_tokens=request.max_completion_tokens,
-                top_p=request.top_p,
-                stop=request.stop,
-                tools=tools,
-                tool_choice=_serialize_tool_choice(request.tool_choice),
-                parallel_tool_calls=request.parallel_tool_calls,
-                reasoning_effort=request.reasoning_effort,
-                verbosity=request.verbosity,
-            )
-        )
+        api_task = asyncio.create_task(global_client.runner.create_completion(**kwargs))
 
         # Send keepalive pings while waiting for the API response
-        while not api_task.done():
-            try:
-                await asyncio.wait_for(
-                    asyncio.shield(api_task), timeout=keepalive_interval
-                )
-            except TimeoutError:
-                # API call still in progress - send keepalive ping
-                yield ": ping\n\n"
+        while True:
+            done, _ = await asyncio.wait({api_task}, timeout=keepalive_interval)
+            if done:
+                break
+            # API call still in progress - send keepalive ping
+            yield _PING_SSE
 
         # Get the result (will raise if the task failed)
-        dedalus_response = cast(Any, await api_task)
+        dedalus_response: Any = await api_task
 
         response_message = dedalus_response.choices[0].message
         content = getattr(response_message, "content", None)
@@ -411,109 +643,50 @@ async def _stream_google_with_tools(
 
         # Extract tool calls if present
         tool_call_deltas = None
-        if hasattr(response_message, "tool_calls") and response_message.tool_calls:
+        message_tool_calls = getattr(response_message, "tool_calls", None)
+        if message_tool_calls:
             tool_call_deltas = []
-            for idx, tc in enumerate(response_message.tool_calls):
-                thought_signature = None
-                if hasattr(tc, "thought_signature") and tc.thought_signature:
-                    thought_signature = tc.thought_signature
-
+            for idx, tc in enumerate(message_tool_calls):
+                function = tc.function
                 tool_call_deltas.append(
-                    ToolCallDelta(
+                    _tool_call_delta(
                         index=idx,
                         id=tc.id,
-                        type=tc.type if hasattr(tc, "type") else "function",
+                        type=getattr(tc, "type", "function"),
                         function={
-                            "name": tc.function.name,
-                            "arguments": tc.function.arguments,
+                            "name": function.name,
+                            "arguments": function.arguments,
                         },
-                        thought_signature=thought_signature,
+                        thought_signature=(
+                            getattr(tc, "thought_signature", None) or None
+                        ),
                     )
                 )
 
         # Simulate streaming: first chunk with role
-        first_chunk = ChatCompletionChunk(
-            id=completion_id,
-            created=created,
-            model=request.model,
-            choices=[
-                ChatCompletionChunkChoice(
-                    index=0,
-                    delta=ChatCompletionChunkDelta(role="assistant"),
-                    finish_reason=None,
-                )
-            ],
-        )
-        yield f"data: {first_chunk.model_dump_json(exclude_none=True)}\n\n"
+        prefix = _chunk_prefix(completion_id, created, request.model)
+        yield _sse_chunk(prefix, {"role": "assistant"})
 
         # Second chunk with content and/or tool calls
         if content or tool_call_deltas:
-            content_chunk = ChatCompletionChunk(
-                id=completion_id,
-                created=created,
-                model=request.model,
-                choices=[
-                    ChatCompletionChunkChoice(
-                        index=0,
-                        delta=ChatCompletionChunkDelta(
-                            content=content,
-                            tool_calls=tool_call_deltas,
-                        ),
-                        finish_reason=None,
-                    )
-                ],
-            )
-            yield f"data: {content_chunk.model_dump_json(exclude_none=True)}\n\n"
+            delta: dict[str, Any] = {}
+            if content is not None:
+                delta["content"] = content
+            if tool_call_deltas is not None:
+                delta["tool_calls"] = tool_call_deltas
+            yield _sse_chunk(prefix, delta)
 
         # Final chunk with finish_reason
-        final_chunk = ChatCompletionChunk(
-            id=completion_id,
-            created=created,
-            model=request.model,
-            choices=[
-                ChatCompletionChunkChoice(
-                    index=0,
-                    delta=ChatCompletionChunkDelta(),
-                    finish_reason=finish_reason,
-                )
-            ],
-        )
-        yield f"data: {final_chunk.model_dump_json(exclude_none=True)}\n\n"
-        yield "data: [DONE]\n\n"
+        yield _sse_chunk(prefix, {}, finish_reason)
+        yield _DONE_SSE
 
-    except dedalus_labs.AuthenticationError:
-        logger.error(
-            "Authentication failed during Google streaming fallback: %s", request.model
-        )
-        error_data = {"error": {"message": "Authentication failed: Invalid API key"}}
-        yield f"data: {orjson.dumps(error_data).decode()}\n\n"
-    except dedalus_labs.APITimeoutError as e:
-        logger.error("Request timed out during Google streaming fallback: %s", str(e))
-        error_data = {
-            "error": {
-                "message": "Request timed out. Try reducing the complexity of your query."
-            }
-        }
-        yield f"data: {orjson.dumps(error_data).decode()}\n\n"
-    except dedalus_labs.APIConnectionError as e:
-        logger.error("Connection failed during Google streaming fallback: %s", str(e))
-        error_data = {
-            "error": {"message": f"Failed to connect to Dedalus API: {str(e)}"}
-        }
-        yield f"data: {orjson.dumps(error_data).decode()}\n\n"
-    except dedalus_labs.APIStatusError as e:
-        logger.error(
-            "API error during Google streaming fallback (status %d): %s",
-            e.status_code,
-            e.message,
-        )
-        error_data = {"error": {"message": e.message, "code": str(e.status_code)}}
-        yield f"data: {orjson.dumps(error_data).decode()}\n\n"
+    except (dedalus_labs.APIConnectionError, dedalus_labs.APIStatusError) as e:
+        yield _stream_error_sse(e, request.model, "Google streaming fallback")
 
 
 async def _stream_chat_completion(
     request: ChatCompletionRequest,
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     """Stream chat completion chunks.
 
     Args:
@@ -532,38 +705,23 @@ async def _stream_chat_completion(
             yield chunk
         return
 
-    completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+    completion_id = f"chatcmpl-{secrets.token_hex(12)}"
     created = int(time.time())
+    prefix = _chunk_prefix(completion_id, created, request.model)
 
     try:
-        messages = [msg.model_dump(exclude_none=True) for msg in request.messages]
-
-        tools = (
-            [tool.model_dump(exclude_none=True) for tool in request.tools]
-            if request.tools
-            else None
-        )
+        kwargs = _build_completion_kwargs(request, stream=True, for_google=False)
+        tools = kwargs["tools"]
 
-        if tools:
+        if tools and logger.isEnabledFor(logging.DEBUG):
+            # Truncate before decoding; "replace" covers a split multi-byte char
             logger.debug(
-                "First tool being sent: %s", orjson.dumps(tools[0]).decode()[:500]
+                "First tool being sent: %s",
+                orjson.dumps(tools[0])[:500].decode("utf-8", "replace"),
             )
 
-        stream = await global_client.runner.create_completion(
-            model=dedalus_model,
-            messages=messages,
-            stream=True,
-            temperature=request.temperature,
-            max_tokens=request.max_tokens,
-            max_completion_tokens=request.max_completion_tokens,
-            top_p=request.top_p,
-            stop=request.stop,
-            tools=tools,
-            tool_choice=_serialize_tool_choice(request.tool_choice),
-            parallel_tool_calls=request.parallel_tool_calls,
-            reasoning_effort=request.reasoning_effort,
-            verbosity=request.verbosity,
-        )
+        # Chunks arrive as plain dicts instead of SDK models
+        stream = await global_client.runner.create_completion(**kwargs, raw=True)
 
         # Wrap stream with keepalive to prevent connection drops during large responses
         keepalive_interval = config.stream_keepalive_interval
@@ -576,7 +734,7 @@ async def _stream_chat_completion(
             if chunk is None:
                 # SSE comment - ignored by clients but keeps connection alive
                 logger.debug("Sending keepalive ping (chunk %d)", chunk_count)
-                yield ": ping\n\n"
+                yield _PING_SSE
                 continue
 
             chunk_count += 1
@@ -585,9 +743,10 @@ async def _stream_chat_completion(
             # Track tool call argument sizes for debugging
             if tool_calls:
                 for tc in tool_calls:
-                    if tc.function and tc.function.get("arguments"):
-                        args_chunk = tc.function["arguments"]
-                        idx = tc.index
+                    function = tc.get("function")
+                    if function and function.get("arguments"):
+                        args_chunk = function["arguments"]
+                        idx = tc["index"]
                         tool_call_args_size[idx] = tool_call_args_size.get(
                             idx, 0
                         ) + len(args_chunk)
@@ -616,26 +775,15 @@ async def _stream_chat_completion(
                         tool_call_args_size,
                     )
 
-            delta = ChatCompletionChunkDelta(
-                role=role,
-                content=delta_content,
-                tool_calls=tool_calls,
-            )
-
-            sse_chunk = ChatCompletionChunk(
-                id=completion_id,
-                created=created,
-                model=request.model,
-                choices=[
-                    ChatCompletionChunkChoice(
-                        index=0,
-                        delta=delta,
-                        finish_reason=finish_reason,
-                    )
-                ],
-            )
+            delta: dict[str, Any] = {}
+            if role is not None:
+                delta["role"] = role
+            if delta_content is not None:
+                delta["content"] = delta_content
+            if tool_calls is not None:
+                delta["tool_calls"] = tool_calls
 
-            yield f"data: {sse_chunk.model_dump_json(exclude_none=True)}\n\n"
+            yield _sse_chunk(prefix, delta, finish_reason)
 
         # Log summary if we didn't see a finish_reason (abnormal termination)
         if final_finish_reason is None:
@@ -645,90 +793,48 @@ async def _stream_chat_completion(
                 tool_call_args_size,
             )
 
-        yield "data: [DONE]\n\n"
+        yield _DONE_SSE
 
-    except dedalus_labs.AuthenticationError:
-        logger.error(
-            "Authentication failed during streaming for model: %s", request.model
-        )
-        error_data = {"error": {"message": "Authentication failed: Invalid API key"}}
-        yield f"data: {orjson.dumps(error_data).decode()}\n\n"
-    except dedalus_labs.APITimeoutError as e:
-        logger.error("Request timed out during streaming: %s", str(e))
-        error_data = {
-            "error": {
-                "message": "Request timed out. Try reducing the complexity of your query."
-            }
-        }
-        yield f"data: {orjson.dumps(error_data).decode()}\n\n"
-    except dedalus_labs.APIConnectionError as e:
-        logger.error("Connection failed during streaming: %s", str(e))
-        error_data = {
-            "error": {"message": f"Failed to connect to Dedalus API: {str(e)}"}
-        }
-        yield f"data: {orjson.dumps(error_data).decode()}\n\n"
-    except dedalus_labs.APIStatusError as e:
-        logger.error(
-            "API error during streaming (status %d): %s", e.status_code, e.message
-        )
-        error_data = {"error": {"message": e.message, "code": str(e.status_code)}}
-        yield f"data: {orjson.dumps(error_data).decode()}\n\n"
+    except (dedalus_labs.APIConnectionError, dedalus_labs.APIStatusError) as e:
+        yield _stream_error_sse(e, request.model, "streaming")
 
 
-def _extract_tool_calls(message: Any) -> list[ToolCall] | None:
+def _extract_tool_calls(message: Any) -> list[dict[str, Any]] | None:
     """Extract tool calls from a message.
 
     Args:
         message: The message object from the response.
 
     Returns:
-        List of ToolCall objects or None.
+        List of tool calls shaped like ``ToolCall.model_dump()``, or None.
     """
-    if not hasattr(message, "tool_calls") or not message.tool_calls:
+    message_tool_calls = getattr(message, "tool_calls", None)
+    if not message_tool_calls:
         return None
 
     tool_calls = []
-    for tc in message.tool_calls:
-        thought_signature = None
-        if hasattr(tc, "thought_signature") and tc.thought_signature:
-            thought_signature = tc.thought_signature
-
-        tool_call = ToolCall(
-            id=tc.id,
-            type=tc.type if hasattr(tc, "type") else "function",
-            function=FunctionCall(
-                name=tc.function.name,
-                arguments=tc.function.arguments,
-            ),
-            thought_signature=thought_signature,
+    for tc in message_tool_calls:
+        function = tc.function
+        tool_calls.append(
+            {
+                "id": tc.id,
+                "type": getattr(tc, "type", "function"),
+                "function": {
+                    "name": function.name,
+                    "arguments": function.arguments,
+                },
+                "thought_signature": getattr(tc, "thought_signature", None) or None,
+            }
         )
-        tool_calls.append(tool_call)
     return tool_calls
 
 
-@router.post("/v1/chat/completions", response_model=None)
-async def chat_completions(
-    request: ChatCompletionRequest,
-) -> ChatCompletionResponse | StreamingResponse:
-    """Handle chat completion requests.
+def _log_request_details(request: ChatCompletionRequest) -> None:
+    """Log request parameters, messages and tools at debug level.
 
     Args:
         request: The chat completion request.
-
-    Returns:
-        Chat completion response or streaming response.
-
-    Raises:
-        HTTPException: On validation or API errors.
     """
-    logger.info(
-        "Chat completion: model=%s, stream=%s, messages=%d, tools=%d",
-        request.model,
-        request.stream,
-        len(request.messages),
-        len(request.tools) if request.tools else 0,
-    )
-
     logger.debug(
         "Request details: temp=%s, max_tokens=%s, max_completion_tokens=%s, "
         "tool_choice=%s, parallel_tool_calls=%s",
@@ -759,6 +865,34 @@ async def chat_completions(
             "  tools: %s%s", tool_names, "..." if len(request.tools) > 5 else ""
         )
 
+
+@router.post("/v1/chat/completions", response_model=None)
+async def chat_completions(
+    request: ChatCompletionRequest,
+) -> ORJSONResponse | StreamingResponse:
+    """Handle chat completion requests.
+
+    Args:
+        request: The chat completion request.
+
+    Returns:
+        Chat completion response or streaming response.
+
+    Raises:
+        HTTPException: On validation or API errors.
+    """
+    logger.info(
+        "Chat completion: model=%s, stream=%s, messages=%d, tools=%d",
+        request.model,
+        request.stream,
+        len(request.messages),
+        len(request.tools) if request.tools else 0,
+    )
+
+    # Walking the message history is only worth it when the lines are emitted
+    if logger.isEnabledFor(logging.DEBUG):
+        _log_request_details(request)
+
     if request.stream:
         return StreamingResponse(
             _stream_chat_completion(request),
@@ -767,42 +901,13 @@ async def chat_completions(
         )
 
     dedalus_model = request.model
+    is_google = _is_google_model(dedalus_model)
+    created = int(time.time())
 
     try:
-        messages = [msg.model_dump(exclude_none=True) for msg in request.messages]
-
-        # Inject thought_signature for Google models (required for Gemini 3)
-        if _is_google_model(dedalus_model):
-            messages = _inject_thought_signatures(messages)
-
-        tools = (
-            [tool.model_dump(exclude_none=True) for tool in request.tools]
-            if request.tools
-            else None
-        )
-
-        # Sanitize tools for Google API compatibility
-        if tools and _is_google_model(dedalus_model):
-            tools = _sanitize_tools_for_google(tools)
+        kwargs = _build_completion_kwargs(request, stream=False, for_google=is_google)
 
-        dedalus_response = cast(
-            Any,
-            await global_client.runner.create_completion(
-                model=dedalus_model,
-                messages=messages,
-                stream=False,
-                temperature=request.temperature,
-                max_tokens=request.max_tokens,
-                max_completion_tokens=request.max_completion_tokens,
-                top_p=request.top_p,
-                stop=request.stop,
-                tools=tools,
-                tool_choice=_serialize_tool_choice(request.tool_choice),
-                parallel_tool_calls=request.parallel_tool_calls,
-                reasoning_effort=request.reasoning_effort,
-                verbosity=request.verbosity,
-            ),
-        )
+        dedalus_response: Any = await global_client.runner.create_completion(**kwargs)
 
         logger.info(
             "Chat completion successful: id=%s, tokens=%d",
@@ -811,35 +916,39 @@ async def chat_completions(
         )
 
         response_message = dedalus_response.choices[0].message
-        content = (
-            response_message.content if hasattr(response_message, "content") else None
-        )
+        content = getattr(response_message, "content", None)
         tool_calls = _extract_tool_calls(response_message)
 
         finish_reason = dedalus_response.choices[0].finish_reason
         if finish_reason:
             finish_reason = str(finish_reason)
 
-        return ChatCompletionResponse(
-            id=dedalus_response.id,
-            created=int(time.time()),
-            model=request.model,
-            choices=[
-                ChatCompletionResponseChoice(
-                    index=0,
-                    message=ChatMessageResponse(
-                        role=response_message.role,
-                        content=content,
-                        tool_calls=tool_calls,
-                    ),
-                    finish_reason=finish_reason,
-                )
-            ],
-            usage=ChatCompletionUsage(
-                prompt_tokens=dedalus_response.usage.prompt_tokens,
-                completion_tokens=dedalus_response.usage.completion_tokens,
-                total_tokens=dedalus_response.usage.total_tokens,
-            ),
+        # Built as a plain dict in the ChatCompletionResponse shape so the body
+        # is encoded by orjson in one pass instead of via jsonable_encoder
+        usage = dedalus_response.usage
+        return ORJSONResponse(
+            {
+                "id": dedalus_response.id,
+                "object": CHAT_COMPLETION_OBJECT,
+                "created": created,
+                "model": request.model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {
+                            "role": response_message.role,
+                            "content": content,
+                            "tool_calls": tool_calls,
+                        },
+                        "finish_reason": finish_reason,
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": usage.prompt_tokens,
+                    "completion_tokens": usage.completion_tokens,
+                    "total_tokens": usage.total_tokens,
+                },
+            }
         )
     except dedalus_labs.AuthenticationError:
         logger.error("Authentication failed for model: %s", dedalus_model)
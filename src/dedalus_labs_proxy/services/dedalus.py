@@ -1,10 +1,11 @@
 """Dedalus SDK wrapper service."""
 
 import logging
+import time
 from collections.abc import AsyncGenerator
 from typing import Any
 
-from dedalus_labs import AsyncDedalus
+from dedalus_labs import AsyncDedalus, AsyncStream
 
 from dedalus_labs_proxy.config import get_config
 
@@ -22,7 +23,7 @@ class DedalusRunner:
         """
         self.client = client
 
-    async def create_completion(  # noqa: C901
+    async def create_completion(
         self,
         model: str,
         messages: list[dict[str, Any]],
@@ -37,6 +38,7 @@ class DedalusRunner:
         parallel_tool_calls: bool | None = None,
         reasoning_effort: str | None = None,
         verbosity: str | None = None,
+        raw: bool = False,
     ) -> AsyncGenerator[Any, None] | Any:
         """Create a chat completion.
 
@@ -54,6 +56,8 @@ class DedalusRunner:
             parallel_tool_calls: Whether to allow parallel tool calls.
             reasoning_effort: Reasoning effort level.
             verbosity: Response verbosity level.
+            raw: When streaming, yield each chunk as the plain dict decoded
+                from the event stream instead of an SDK model.
 
         Returns:
             The completion response or an async generator for streaming.
@@ -68,18 +72,13 @@ class DedalusRunner:
             kwargs["temperature"] = temperature
 
         # Handle max_tokens parameter - prefer max_completion_tokens
-        effective_max_tokens = None
-        if max_completion_tokens is not None:
-            effective_max_tokens = max_completion_tokens
-        elif max_tokens is not None:
-            effective_max_tokens = max_tokens
-        elif tools is not None:
+        effective_max_tokens = (
+            max_completion_tokens if max_completion_tokens is not None else max_tokens
+        )
+        if effective_max_tokens is None and tools is not None:
             # Set default max_tokens for tool-enabled requests
             # Use a high default to support large file writes
-            from dedalus_labs_proxy.config import get_config
-
-            config = get_config()
-            effective_max_tokens = config.tool_max_tokens
+            effective_max_tokens = get_config().tool_max_tokens
             logger.info(
                 "Setting max_tokens=%d for tool-enabled request", effective_max_tokens
             )
@@ -99,20 +98,26 @@ class DedalusRunner:
             len(tools) if tools else 0,
         )
 
-        if top_p is not None:
-            kwargs["top_p"] = top_p
-        if stop is not None:
-            kwargs["stop"] = stop
-        if tools is not None:
-            kwargs["tools"] = tools
-        if tool_choice is not None:
-            kwargs["tool_choice"] = tool_choice
-        if parallel_tool_calls is not None:
-            kwargs["parallel_tool_calls"] = parallel_tool_calls
-        if reasoning_effort is not None:
-            kwargs["reasoning_effort"] = reasoning_effort
-        if verbosity is not None:
-            kwargs["verbosity"] = verbosity
+        optional_params = (
+            ("top_p", top_p),
+            ("stop", stop),
+            ("tools", tools),
+            ("tool_choice", tool_choice),
+            ("parallel_tool_calls", parallel_tool_calls),
+            ("reasoning_effort", reasoning_effort),
+            ("verbosity", verbosity),
+        )
+        kwargs.update(
+            {name: value for name, value in optional_params if value is not None}
+        )
+
+        if stream and raw:
+            # Building a ChatCompletionChunk model per chunk costs several
+            # times more than decoding the JSON itself
+            raw_response = await self.client.chat.completions.with_raw_response.create(
+                **kwargs
+            )
+            return await raw_response.parse(to=AsyncStream[dict[str, Any]])
 
         response = await self.client.chat.completions.create(**kwargs)  # type: ignore[arg-type]
         return response
@@ -121,9 +126,14 @@ class DedalusRunner:
 class DedalusClient:
     """Manages the Dedalus API client lifecycle."""
 
+    # Seconds a successful connection check is reused before probing again
+    VERIFY_TTL = 30.0
+
     def __init__(self) -> None:
         """Initialize the client manager."""
         self._client: AsyncDedalus | None = None
+        self._runner: DedalusRunner | None = None
+        self._verified_at: float | None = None
 
     @property
     def client(self) -> AsyncDedalus:
@@ -138,14 +148,27 @@ class DedalusClient:
             )
         return self._client
 
+    def start(self) -> DedalusRunner:
+        """Create the client and runner ahead of the first request.
+
+        Returns:
+            The runner for the current client.
+        """
+        if self._runner is None:
+            self._runner = DedalusRunner(self.client)
+        return self._runner
+
     @property
     def runner(self) -> DedalusRunner:
-        """Get a runner instance for the current client."""
-        return DedalusRunner(self.client)
+        """Get the runner for the current client, creating it if needed."""
+        return self.start()
 
     async def verify_connection(self) -> bool:
         """Verify the API connection is working.
 
+        The check sends a one-token completion, so a success is reused for
+        ``VERIFY_TTL`` seconds. Failures are never cached.
+
         Returns:
             True if connection is verified.
 
@@ -153,11 +176,16 @@ class DedalusClient:
             AuthenticationError: If API key is invalid.
             APIConnectionError: If connection fails.
         """
+        now = time.monotonic()
+        if self._verified_at is not None and now - self._verified_at < self.VERIFY_TTL:
+            return True
+
         await self.client.chat.completions.create(  # type: ignore[call-overload]
             model="openai/gpt-5-mini",
             messages=[{"role": "user", "content": "test"}],
             max_tokens=1,
         )
+        self._verified_at = now
         return True
 
     async def close(self) -> None:
@@ -165,6 +193,8 @@ class DedalusClient:
         if self._client is not None:
             await self._client.close()
             self._client = None
+        self._runner = None
+        self._verified_at = None
 
 
 # Global client instance
@@ -0,0 +1,21 @@
+"""Shared fixtures for the test suite."""
+
+import os
+from collections.abc import AsyncGenerator
+
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+# Set API key before importing app
+os.environ["DEDALUS_API_KEY"] = "test-api-key"
+
+from dedalus_labs_proxy.main import app
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client() -> AsyncGenerator[AsyncClient, None]:
+    """Create an async HTTP client shared by the whole test session."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
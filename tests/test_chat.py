@@ -1,48 +1,53 @@
 """Tests for chat completions endpoint."""
 
-import os
+import asyncio
+import copy
 from collections.abc import AsyncGenerator
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
 
+import orjson
 import pytest
-import pytest_asyncio
-from httpx import ASGITransport, AsyncClient
+from httpx import AsyncClient
 
-# Set API key before importing app
-os.environ["DEDALUS_API_KEY"] = "test-api-key"
+from dedalus_labs_proxy.models.responses import ChatCompletionChunk
+from dedalus_labs_proxy.routes import chat, health
+from dedalus_labs_proxy.routes.chat import (
+    _chunk_prefix,
+    _extract_delta,
+    _inject_thought_signatures,
+    _iter_with_keepalive,
+    _sanitize_tool_schema,
+    _sanitize_tools_for_google,
+    _sse_chunk,
+)
 
 
 class MockMessage:
     """Mock message for testing."""
 
+    __slots__ = ("content", "role", "tool_calls")
+
     def __init__(self, content: str, tool_calls: list[Any] | None = None) -> None:
         self.content = content
         self.role = "assistant"
         self.tool_calls = tool_calls
 
 
-class MockDelta:
-    """Mock delta for streaming tests."""
-
-    def __init__(self, content: str, role: str | None = None) -> None:
-        self.content = content
-        self.role = role
-        self.tool_calls = None
-
-
 class MockChoice:
     """Mock choice for testing."""
 
+    __slots__ = ("message", "finish_reason")
+
     def __init__(self, content: str, finish_reason: str = "stop") -> None:
         self.message = MockMessage(content)
-        self.delta = MockDelta(content)
         self.finish_reason = finish_reason
 
 
 class MockUsage:
     """Mock usage for testing."""
 
+    __slots__ = ("prompt_tokens", "completion_tokens", "total_tokens")
+
     def __init__(self) -> None:
         self.prompt_tokens = 10
         self.completion_tokens = 5
@@ -52,6 +57,8 @@ class MockUsage:
 class MockResponse:
     """Mock response for testing."""
 
+    __slots__ = ("id", "choices", "usage")
+
     def __init__(
         self, content: str = "Test response", finish_reason: str = "stop"
     ) -> None:
@@ -60,49 +67,116 @@ class MockResponse:
         self.usage = MockUsage()
 
 
-def create_mock_global_client() -> MagicMock:
+def _stream_chunk(
+    delta: dict[str, Any], finish_reason: str | None = None
+) -> dict[str, Any]:
+    """Build a streaming chunk as decoded from the SDK's raw event stream."""
+    return {
+        "id": "chatcmpl-123",
+        "object": "chat.completion.chunk",
+        "created": 1700000000,
+        "model": "openai/gpt-4",
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+
+
+# Chunks yielded by the mocked streaming completion, built once at import.
+# The routes stream with raw=True, so chunks are plain dicts.
+_STREAM_CHUNKS: tuple[dict[str, Any], ...] = (
+    # First chunk with role
+    _stream_chunk({"role": "assistant", "content": "Hello "}),
+    # Second chunk with content
+    _stream_chunk({"content": "world!"}),
+    # Tool call opening with its id and name, then an argument fragment
+    _stream_chunk(
+        {
+            "tool_calls": [
+                {
+                    "index": 0,
+                    "id": "call_1",
+                    "type": "function",
+                    "function": {"name": "lookup", "arguments": ""},
+                }
+            ]
+        }
+    ),
+    _stream_chunk({"tool_calls": [{"index": 0, "function": {"arguments": '{"q":1}'}}]}),
+    # Final chunk with finish_reason
+    _stream_chunk({}, finish_reason="tool_calls"),
+    # Usage-only chunk with no choices
+    {
+        "id": "chatcmpl-123",
+        "object": "chat.completion.chunk",
+        "created": 1700000000,
+        "model": "openai/gpt-4",
+        "choices": [],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+    },
+)
+
+
+# Request bodies shared by several tests, encoded once at import
+_JSON_HEADERS = {"content-type": "application/json"}
+_HELLO_PAYLOAD = orjson.dumps(
+    {
+        "model": "openai/gpt-4",
+        "messages": [{"role": "user", "content": "Hello"}],
+        "stream": False,
+    }
+)
+_HELLO_STREAM_PAYLOAD = orjson.dumps(
+    {
+        "model": "openai/gpt-4",
+        "messages": [{"role": "user", "content": "Hello"}],
+        "stream": True,
+    }
+)
+
+
+class MockRunner:
+    """Mock Dedalus runner for testing."""
+
+    async def create_completion(self, *args: Any, **kwargs: Any) -> Any:
+        """Return no completion unless a fixture replaces this method."""
+        return None
+
+
+class MockGlobalClient:
+    """Mock global client for testing."""
+
+    def __init__(self) -> None:
+        self.runner = MockRunner()
+
+    async def verify_connection(self) -> bool:
+        """Report the connection as verified."""
+        return True
+
+
+def create_mock_global_client() -> MockGlobalClient:
     """Create a mock global client."""
-    mock_runner = MagicMock()
-    mock_runner.create_completion = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.runner = mock_runner
-    mock_client.verify_connection = AsyncMock(return_value=True)
-    return mock_client
+    return MockGlobalClient()
 
 
 @pytest.fixture
-def mock_global_client() -> MagicMock:
+def mock_global_client() -> MockGlobalClient:
     """Fixture for mock global client."""
     return create_mock_global_client()
 
 
 @pytest.fixture
-def mock_dedalus_runner(mock_global_client: MagicMock) -> MagicMock:
+def mock_dedalus_runner(mock_global_client: MockGlobalClient) -> MockGlobalClient:
     """Fixture that patches the global client."""
 
     async def mock_create_completion(*args: Any, **kwargs: Any) -> Any:
         stream = kwargs.get("stream", False)
 
         if stream:
+            # Streaming routes always request raw dict chunks
+            assert kwargs.get("raw") is True
 
-            async def stream_gen() -> AsyncGenerator[MockResponse, None]:
-                # First chunk with role
-                response = MockResponse("Hello ", "")
-                response.choices[0].delta = MockDelta("Hello ", "assistant")
-                response.choices[0].finish_reason = None
-                yield response
-
-                # Second chunk with content
-                response2 = MockResponse("world!", "")
-                response2.choices[0].delta = MockDelta("world!")
-                response2.choices[0].finish_reason = None
-                yield response2
-
-                # Final chunk with finish_reason
-                response3 = MockResponse("", "stop")
-                response3.choices[0].delta = MockDelta("")
-                response3.choices[0].finish_reason = "stop"
-                yield response3
+            async def stream_gen() -> AsyncGenerator[dict[str, Any], None]:
+                for chunk in _STREAM_CHUNKS:
+                    yield chunk
 
             return stream_gen()
         return MockResponse("Test response")
@@ -111,124 +185,131 @@ def mock_dedalus_runner(mock_global_client: MagicMock) -> MagicMock:
     return mock_global_client
 
 
-@pytest_asyncio.fixture
-async def async_client(
-    mock_dedalus_runner: MagicMock,
-) -> AsyncGenerator[AsyncClient, None]:
-    """Create an async HTTP client for testing with mocked Dedalus client."""
-    # Patch the global client
-    from dedalus_labs_proxy.routes import chat, health
-    from dedalus_labs_proxy.services import dedalus
-
-    original_client = dedalus.global_client
-    chat.global_client = mock_dedalus_runner
-    health.global_client = mock_dedalus_runner
-
-    from dedalus_labs_proxy.main import app
-
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://test"
-    ) as client:
-        yield client
-
-    # Restore
-    chat.global_client = original_client
-    health.global_client = original_client
+@pytest.fixture(autouse=True)
+def patch_global_client(
+    mock_dedalus_runner: MockGlobalClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Patch the global client used by the routes with the mocked one."""
+    monkeypatch.setattr(chat, "global_client", mock_dedalus_runner)
+    monkeypatch.setattr(health, "global_client", mock_dedalus_runner)
 
 
-@pytest.mark.asyncio
 async def test_chat_completions_non_streaming(async_client: AsyncClient) -> None:
     """Test non-streaming chat completion."""
-    payload = {
-        "model": "openai/gpt-4",
-        "messages": [{"role": "user", "content": "Hello"}],
-        "stream": False,
-    }
-    response = await async_client.post("/v1/chat/completions", json=payload)
+    response = await async_client.post(
+        "/v1/chat/completions", content=_HELLO_PAYLOAD, headers=_JSON_HEADERS
+    )
     assert response.status_code == 200
 
-    data = response.json()
-    assert "id" in data
-    assert data["object"] == "chat.completion"
-    assert data["model"] == "openai/gpt-4"
-    assert len(data["choices"]) > 0
-    assert "message" in data["choices"][0]
-    assert data["choices"][0]["message"]["role"] == "assistant"
-    assert "usage" in data
-
-
-@pytest.mark.asyncio
-async def test_chat_completions_with_temperature(async_client: AsyncClient) -> None:
-    """Test chat completion with temperature parameter."""
-    payload = {
+    data = orjson.loads(response.content)
+    assert data == {
+        "id": "chatcmpl-123",
+        "object": "chat.completion",
+        "created": data["created"],
         "model": "openai/gpt-4",
-        "messages": [{"role": "user", "content": "Hello"}],
-        "temperature": 0.7,
+        "choices": [
+            {
+                "index": 0,
+                "message": {
+                    "role": "assistant",
+                    "content": "Test response",
+                    "tool_calls": None,
+                },
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
     }
-    response = await async_client.post("/v1/chat/completions", json=payload)
-    assert response.status_code == 200
 
 
-@pytest.mark.asyncio
-async def test_chat_completions_with_max_tokens(async_client: AsyncClient) -> None:
-    """Test chat completion with max_tokens parameter."""
+@pytest.mark.parametrize(
+    "param",
+    [{"temperature": 0.7}, {"max_tokens": 100}, {"top_p": 0.9}],
+    ids=["temperature", "max_tokens", "top_p"],
+)
+async def test_chat_completions_with_sampling_param(
+    async_client: AsyncClient, param: dict[str, Any]
+) -> None:
+    """Test chat completion with an optional sampling parameter."""
     payload = {
         "model": "openai/gpt-4",
         "messages": [{"role": "user", "content": "Hello"}],
-        "max_tokens": 100,
+        **param,
     }
     response = await async_client.post("/v1/chat/completions", json=payload)
     assert response.status_code == 200
 
 
-@pytest.mark.asyncio
-async def test_chat_completions_with_top_p(async_client: AsyncClient) -> None:
-    """Test chat completion with top_p parameter."""
+@pytest.mark.parametrize(
+    "model",
+    [
+        "openai/gpt-4",
+        "openai/gpt-4o",
+        "anthropic/claude-3-opus",
+        "google/gemini-pro",
+    ],
+)
+async def test_chat_completions_different_models(
+    async_client: AsyncClient, model: str
+) -> None:
+    """Test chat completion with different model names."""
     payload = {
-        "model": "openai/gpt-4",
+        "model": model,
         "messages": [{"role": "user", "content": "Hello"}],
-        "top_p": 0.9,
     }
     response = await async_client.post("/v1/chat/completions", json=payload)
     assert response.status_code == 200
+    assert orjson.loads(response.content)["model"] == model
 
 
-@pytest.mark.asyncio
-async def test_chat_completions_different_models(async_client: AsyncClient) -> None:
-    """Test chat completion with different model names."""
-    for model in [
-        "openai/gpt-4",
-        "openai/gpt-4o",
-        "anthropic/claude-3-opus",
-        "google/gemini-pro",
-    ]:
-        payload = {
-            "model": model,
-            "messages": [{"role": "user", "content": "Hello"}],
-        }
-        response = await async_client.post("/v1/chat/completions", json=payload)
+async def test_chat_completions_streaming(async_client: AsyncClient) -> None:
+    """Test streaming chat completion."""
+    saw_data = saw_done = False
+    async with async_client.stream(
+        "POST",
+        "/v1/chat/completions",
+        content=_HELLO_STREAM_PAYLOAD,
+        headers=_JSON_HEADERS,
+    ) as response:
         assert response.status_code == 200
-        assert response.json()["model"] == model
+        assert "text/event-stream" in response.headers["content-type"]
 
+        async for line in response.aiter_lines():
+            if line == "data: [DONE]":
+                saw_done = True
+                break
+            saw_data = saw_data or line.startswith("data: ")
 
-@pytest.mark.asyncio
-async def test_chat_completions_streaming(async_client: AsyncClient) -> None:
-    """Test streaming chat completion."""
-    payload = {
-        "model": "openai/gpt-4",
-        "messages": [{"role": "user", "content": "Hello"}],
-        "stream": True,
-    }
-    response = await async_client.post("/v1/chat/completions", json=payload)
+    assert saw_data
+    assert saw_done
+
+
+async def test_chat_completions_streaming_frames(async_client: AsyncClient) -> None:
+    """Test the exact SSE frames produced from raw dict chunks."""
+    response = await async_client.post(
+        "/v1/chat/completions", content=_HELLO_STREAM_PAYLOAD, headers=_JSON_HEADERS
+    )
     assert response.status_code == 200
-    assert "text/event-stream" in response.headers["content-type"]
 
-    content = response.text
-    assert "data: " in content
-    assert "[DONE]" in content
+    frames = response.content.split(b"\n\n")
+    assert frames[-2:] == [b"data: [DONE]", b""]
+    first = orjson.loads(frames[0].removeprefix(b"data: "))
+    head = (
+        f'data: {{"id":"{first["id"]}","object":"chat.completion.chunk",'
+        f'"created":{first["created"]},"model":"openai/gpt-4","choices":[{{"index":0,'
+    )
+    assert [frame.decode() for frame in frames[:-2]] == [
+        head + '"delta":{"role":"assistant","content":"Hello "}}]}',
+        head + '"delta":{"content":"world!"}}]}',
+        head + '"delta":{"tool_calls":[{"index":0,"id":"call_1","type":"function",'
+        '"function":{"name":"lookup","arguments":null}}]}}]}',
+        head + '"delta":{"tool_calls":[{"index":0,'
+        '"function":{"name":null,"arguments":"{\\"q\\":1}"}}]}}]}',
+        head + '"delta":{},"finish_reason":"tool_calls"}]}',
+        head + '"delta":{}}]}',
+    ]
 
 
-@pytest.mark.asyncio
 async def test_chat_completions_missing_messages(async_client: AsyncClient) -> None:
     """Test chat completion without messages field."""
     payload = {
@@ -238,7 +319,6 @@ async def test_chat_completions_missing_messages(async_client: AsyncClient) -> N
     assert response.status_code == 422
 
 
-@pytest.mark.asyncio
 async def test_chat_completions_missing_model(async_client: AsyncClient) -> None:
     """Test chat completion without model field."""
     payload = {
@@ -248,7 +328,6 @@ async def test_chat_completions_missing_model(async_client: AsyncClient) -> None
     assert response.status_code == 422
 
 
-@pytest.mark.asyncio
 async def test_multiple_messages_in_chat_completions(
     async_client: AsyncClient,
 ) -> None:
@@ -266,15 +345,11 @@ async def test_multiple_messages_in_chat_completions(
     assert response.status_code == 200
 
 
-@pytest.mark.asyncio
 async def test_streaming_response_has_sse_headers(async_client: AsyncClient) -> None:
     """Test that streaming responses include proper SSE headers to prevent buffering."""
-    payload = {
-        "model": "openai/gpt-4",
-        "messages": [{"role": "user", "content": "Hello"}],
-        "stream": True,
-    }
-    response = await async_client.post("/v1/chat/completions", json=payload)
+    response = await async_client.post(
+        "/v1/chat/completions", content=_HELLO_STREAM_PAYLOAD, headers=_JSON_HEADERS
+    )
     assert response.status_code == 200
 
     # Check for SSE-specific headers that prevent buffering
@@ -285,25 +360,256 @@ async def test_streaming_response_has_sse_headers(async_client: AsyncClient) ->
     assert response.headers.get("x-accel-buffering") == "no"
 
 
-@pytest.mark.asyncio
 async def test_iter_with_keepalive_sends_ping_on_timeout() -> None:
     """Test that _iter_with_keepalive yields None (ping signal) when stream is slow."""
-    import asyncio
-
-    from dedalus_labs_proxy.routes.chat import _iter_with_keepalive
+    # The stream stalls until the consumer has seen a ping, so the test takes
+    # one keepalive interval rather than a fixed sleep
+    ping_seen = asyncio.Event()
 
     async def slow_stream() -> AsyncGenerator[str, None]:
         yield "first"
-        await asyncio.sleep(0.3)  # Longer than keepalive interval
+        await ping_seen.wait()
         yield "second"
 
-    # Use a very short keepalive interval for testing
     results = []
-    async for item in _iter_with_keepalive(slow_stream(), keepalive_interval=0.1):
+    async for item in _iter_with_keepalive(slow_stream(), keepalive_interval=0.01):
         results.append(item)
+        if item is None:
+            ping_seen.set()
 
-    # Should have: "first", None (ping), None (ping), "second"
-    # (at least one None ping during the 0.3s wait with 0.1s interval)
-    assert "first" in results
-    assert "second" in results
+    assert results[0] == "first"
+    assert results[-1] == "second"
     assert None in results  # At least one keepalive ping was sent
+
+
+def test_sse_chunk_matches_chunk_model() -> None:
+    """Test that pre-encoded chunk frames match the ChatCompletionChunk schema."""
+    prefix = _chunk_prefix("chatcmpl-abc", 1700000000, "openai/gpt-4o")
+    delta = {"content": 'Hello "world" ✓'}
+
+    for finish_reason in (None, "stop"):
+        frame = _sse_chunk(prefix, delta, finish_reason)
+
+        assert frame.startswith(b"data: ")
+        assert frame.endswith(b"\n\n")
+        chunk = ChatCompletionChunk.model_validate_json(frame[6:-2])
+        assert orjson.loads(frame[6:-2]) == chunk.model_dump(exclude_none=True)
+        assert chunk.choices[0].delta.content == delta["content"]
+        assert chunk.choices[0].finish_reason == finish_reason
+
+
+def test_sanitize_tool_schema_removes_keywords_without_mutating() -> None:
+    """Test that disallowed keywords are dropped and untouched subtrees shared."""
+    clean_items = {"type": "string"}
+    schema = {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "type": "object",
+        "additionalProperties": False,
+        "properties": {
+            "maxLength": {"type": "integer", "minimum": 0},
+            "tags": {"type": "array", "items": clean_items, "maxItems": 3},
+        },
+        "anyOf": [{"required": ["tags"]}, {"minItems": 1}],
+    }
+    original = copy.deepcopy(schema)
+
+    result = _sanitize_tool_schema(schema)
+
+    assert result == {
+        "type": "object",
+        "properties": {
+            "maxLength": {"type": "integer"},
+            "tags": {"type": "array", "items": clean_items},
+        },
+        "anyOf": [{"required": ["tags"]}, {}],
+    }
+    assert schema == original
+    assert result["properties"]["tags"]["items"] is clean_items
+    assert result["anyOf"][0] is schema["anyOf"][0]
+    assert _sanitize_tool_schema(result) is result
+
+
+def test_sanitize_tools_for_google_cached_results_are_independent() -> None:
+    """Test that cached tool sanitization returns fresh, order-preserving copies."""
+    tool = {
+        "type": "function",
+        "function": {
+            "name": "write",
+            "parameters": {
+                "type": "object",
+                "properties": {"z": {"type": "string"}, "a": {"maxLength": 5}},
+            },
+        },
+    }
+
+    first = _sanitize_tools_for_google([tool])
+    first[0]["function"]["name"] = "mutated"
+    second = _sanitize_tools_for_google([tool])
+
+    assert second[0]["function"]["name"] == "write"
+    assert list(second[0]["function"]["parameters"]["properties"]) == ["z", "a"]
+    assert second[0]["function"]["parameters"]["properties"]["a"] == {}
+    assert "maxLength" in tool["function"]["parameters"]["properties"]["a"]
+
+
+def test_inject_thought_signatures_copies_only_changed_messages() -> None:
+    """Test that only messages missing a first-call signature are copied."""
+    signed = {
+        "role": "assistant",
+        "tool_calls": [{"id": "a", "thought_signature": "sig"}, {"id": "b"}],
+    }
+    unsigned = {"role": "assistant", "tool_calls": [{"id": "c"}, {"id": "d"}]}
+    user = {"role": "user", "content": "hi"}
+
+    result = _inject_thought_signatures([user, signed, unsigned])
+
+    assert result[0] is user
+    assert result[1] is signed
+    assert result[2] is not unsigned
+    assert result[2]["tool_calls"][0]["thought_signature"]
+    assert "thought_signature" not in result[2]["tool_calls"][1]
+    assert "thought_signature" not in unsigned["tool_calls"][0]
+
+
+async def test_iter_with_keepalive_propagates_stream_errors() -> None:
+    """Test that _iter_with_keepalive re-raises errors from the wrapped stream."""
+
+    async def failing_stream() -> AsyncGenerator[str, None]:
+        yield "first"
+        raise RuntimeError("upstream failed")
+
+    results = []
+    with pytest.raises(RuntimeError, match="upstream failed"):
+        async for item in _iter_with_keepalive(failing_stream(), keepalive_interval=1):
+            results.append(item)
+
+    assert results == ["first"]
+
+
+def test_sanitize_tools_for_google_passes_clean_tools_through() -> None:
+    """Test that tools without disallowed keywords are returned unchanged."""
+    clean = {
+        "type": "function",
+        "function": {
+            "name": "read",
+            "parameters": {"type": "object", "properties": {"path": {}}},
+        },
+    }
+    no_params = {"type": "function", "function": {"name": "noop"}}
+
+    result = _sanitize_tools_for_google([clean, no_params])
+
+    assert result[0] is clean
+    assert result[1] is no_params
+
+
+def test_extract_delta_handles_raw_dict_chunks() -> None:
+    """Test that deltas are extracted from chunks decoded as dicts."""
+    base = {"id": "c", "object": "chat.completion.chunk", "created": 1, "model": "m"}
+    cases: list[tuple[list[dict[str, Any]], tuple[Any, ...]]] = [
+        (
+            [{"index": 0, "delta": {"role": "assistant", "content": ""}}],
+            ("assistant", None, None, None),
+        ),
+        (
+            [{"index": 0, "delta": {"content": "Hi"}, "finish_reason": None}],
+            (None, "Hi", None, None),
+        ),
+        (
+            [
+                {
+                    "index": 0,
+                    "delta": {
+                        "tool_calls": [
+                            {
+                                "index": 0,
+                                "id": "call_1",
+                                "type": "function",
+                                "function": {"name": "write", "arguments": ""},
+                            },
+                            {"index": 1, "function": {"arguments": '{"a":1}'}},
+                        ]
+                    },
+                }
+            ],
+            (
+                None,
+                None,
+                [
+                    {
+                        "index": 0,
+                        "id": "call_1",
+                        "type": "function",
+                        "function": {"name": "write", "arguments": None},
+                    },
+                    {"index": 1, "function": {"name": None, "arguments": '{"a":1}'}},
+                ],
+                None,
+            ),
+        ),
+        (
+            [{"index": 0, "delta": {}, "finish_reason": "tool_calls"}],
+            (None, None, None, "tool_calls"),
+        ),
+        (
+            [{"index": 0, "message": {"role": "assistant", "content": "Done"}}],
+            ("assistant", "Done", None, None),
+        ),
+        ([], (None, None, None, None)),
+    ]
+
+    for choices, expected in cases:
+        assert _extract_delta({**base, "choices": choices}) == expected
+
+
+async def test_google_tools_with_huge_integers_are_sanitized(
+    async_client: AsyncClient, mock_dedalus_runner: MockGlobalClient
+) -> None:
+    """Test that tools orjson cannot encode are still sanitized and forwarded."""
+    calls: list[dict[str, Any]] = []
+    create_completion = mock_dedalus_runner.runner.create_completion
+
+    async def capture_create_completion(**kwargs: Any) -> Any:
+        calls.append(kwargs)
+        return await create_completion(**kwargs)
+
+    mock_dedalus_runner.runner.create_completion = capture_create_completion
+    payload = {
+        "model": "google/gemini-pro",
+        "messages": [{"role": "user", "content": "Hello"}],
+        "tools": [
+            {
+                "type": "function",
+                "function": {
+                    "name": "count",
+                    "parameters": {
+                        "$schema": "http://json-schema.org/draft-07/schema#",
+                        "type": "object",
+                        "properties": {
+                            "n": {"type": "integer", "maximum": 2**70},
+                            "big": {"type": "integer", "enum": [2**70]},
+                        },
+                    },
+                },
+            }
+        ],
+    }
+
+    response = await async_client.post("/v1/chat/completions", json=payload)
+
+    assert response.status_code == 200
+    assert calls[0]["tools"] == [
+        {
+            "type": "function",
+            "function": {
+                "name": "count",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "n": {"type": "integer"},
+                        "big": {"type": "integer", "enum": [2**70]},
+                    },
+                },
+            },
+        }
+    ]
@@ -0,0 +1,106 @@
+"""Tests for the Dedalus SDK wrapper service."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import orjson
+import pytest
+from dedalus_labs import AsyncDedalus
+
+from dedalus_labs_proxy.services.dedalus import DedalusClient, DedalusRunner
+
+
+async def test_runner_is_cached_until_close() -> None:
+    """Test that the runner is reused and rebuilt after the client closes."""
+    manager = DedalusClient()
+    first_client = MagicMock(close=AsyncMock())
+    manager._client = first_client
+
+    runner = manager.runner
+    assert manager.runner is runner
+    assert runner.client is first_client
+
+    await manager.close()
+    first_client.close.assert_awaited_once()
+
+    second_client = MagicMock()
+    manager._client = second_client
+    assert manager.runner is not runner
+    assert manager.runner.client is second_client
+
+
+async def test_create_completion_raw_stream_yields_dicts() -> None:
+    """Test that raw streaming yields decoded chunk dicts."""
+    chunk = {
+        "id": "chatcmpl-1",
+        "object": "chat.completion.chunk",
+        "created": 1,
+        "model": "openai/gpt-4o",
+        "choices": [{"index": 0, "delta": {"content": "Hi"}, "finish_reason": None}],
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = b"data: " + orjson.dumps(chunk) + b"\n\ndata: [DONE]\n\n"
+        return httpx.Response(
+            200, content=body, headers={"content-type": "text/event-stream"}
+        )
+
+    client = AsyncDedalus(
+        api_key="test-api-key",
+        base_url="http://test",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    stream = await DedalusRunner(client).create_completion(
+        model="openai/gpt-4o",
+        messages=[{"role": "user", "content": "Hello"}],
+        stream=True,
+        raw=True,
+    )
+
+    assert [item async for item in stream] == [chunk]
+
+
+async def test_verify_connection_reuses_recent_success() -> None:
+    """Test that a successful check is cached for VERIFY_TTL seconds only."""
+    manager = DedalusClient()
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock()
+    manager._client = client
+
+    assert await manager.verify_connection()
+    assert await manager.verify_connection()
+    assert client.chat.completions.create.await_count == 1
+
+    assert manager._verified_at is not None
+    manager._verified_at -= DedalusClient.VERIFY_TTL
+    assert await manager.verify_connection()
+    assert client.chat.completions.create.await_count == 2
+
+
+async def test_verify_connection_does_not_cache_failures() -> None:
+    """Test that a failed check is retried on the next call."""
+    manager = DedalusClient()
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(side_effect=[RuntimeError, None])
+    manager._client = client
+
+    with pytest.raises(RuntimeError):
+        await manager.verify_connection()
+    assert await manager.verify_connection()
+    assert client.chat.completions.create.await_count == 2
+
+
+async def test_start_creates_client_and_runner(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that start builds the client and runner once, ahead of use."""
+    monkeypatch.setenv("DEDALUS_API_KEY", "test-api-key")
+    manager = DedalusClient()
+
+    manager.start()
+    runner = manager.runner
+    manager.start()
+
+    assert manager.runner is runner
+    assert isinstance(runner.client, AsyncDedalus)
+    await manager.close()
@@ -0,0 +1,132 @@
+"""Tests for logging helpers."""
+
+import json
+import logging
+import sys
+
+import orjson
+import pytest
+
+from dedalus_labs_proxy.logging import (
+    JSON_DATEFMT,
+    JSONFormatter,
+    format_headers,
+    sanitize_log_data,
+    setup_logging,
+)
+
+
+def _make_record(msg: str, *args: object) -> logging.LogRecord:
+    """Build a log record for formatter tests."""
+    return logging.LogRecord(
+        "dedalus-proxy", logging.INFO, __file__, 1, msg, args, None
+    )
+
+
+def test_json_formatter_output_is_valid_json() -> None:
+    """Test that JSONFormatter escapes message values correctly."""
+    formatter = JSONFormatter(datefmt=JSON_DATEFMT)
+    record = _make_record('Request: %s "quoted"\n', "POST /v1/chat/completions")
+
+    data = orjson.loads(formatter.format(record))
+
+    assert list(data) == ["timestamp", "level", "logger", "message"]
+    assert data["level"] == "INFO"
+    assert data["logger"] == "dedalus-proxy"
+    assert data["message"] == 'Request: POST /v1/chat/completions "quoted"\n'
+
+
+def test_json_formatter_escapes_lone_surrogates() -> None:
+    """Test that JSONFormatter encodes text orjson rejects instead of failing."""
+    formatter = JSONFormatter(datefmt=JSON_DATEFMT)
+    record = _make_record("Chat completion: model=%s", "a\udc80b")
+
+    data = json.loads(formatter.format(record))
+
+    assert data["message"] == "Chat completion: model=a\udc80b"
+
+
+def test_json_formatter_includes_exception() -> None:
+    """Test that JSONFormatter includes formatted exception info."""
+    formatter = JSONFormatter(datefmt=JSON_DATEFMT)
+    record = _make_record("Failure")
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record.exc_info = sys.exc_info()
+
+    data = orjson.loads(formatter.format(record))
+
+    assert "ValueError: boom" in data["exception"]
+
+
+def test_sanitize_log_data_redacts_default_fields() -> None:
+    """Test that default sensitive fields are redacted case-insensitively."""
+    data = {
+        "Authorization": "Bearer secret",
+        "x-api_key": "secret",
+        "content-type": "application/json",
+        "nested": [{"refresh_token": "secret", "name": "tool"}],
+    }
+
+    assert sanitize_log_data(data) == {
+        "Authorization": "[REDACTED]",
+        "x-api_key": "[REDACTED]",
+        "content-type": "application/json",
+        "nested": [{"refresh_token": "[REDACTED]", "name": "tool"}],
+    }
+
+
+def test_sanitize_log_data_custom_fields() -> None:
+    """Test that custom sensitive fields replace the defaults."""
+    data = {"session": "abc", "token": "xyz"}
+
+    assert sanitize_log_data(data, ["session"]) == {
+        "session": "[REDACTED]",
+        "token": "xyz",
+    }
+    assert sanitize_log_data(data, []) == data
+
+
+def test_format_headers_redacts_sensitive_values() -> None:
+    """Test that format_headers redacts sensitive raw headers."""
+    raw_headers = [
+        (b"host", b"test"),
+        (b"authorization", b"Bearer secret"),
+        (b"x-api-token", b"secret"),
+    ]
+
+    assert format_headers(raw_headers) == (
+        "host=test, authorization=[REDACTED], x-api-token=[REDACTED]"
+    )
+
+
+def test_json_formatter_timestamp_follows_record_time() -> None:
+    """Test that cached timestamps are refreshed when the second changes."""
+    formatter = JSONFormatter(datefmt="%S")
+    first = _make_record("first")
+    second = _make_record("second")
+    first.created = 1_700_000_000.2
+    second.created = 1_700_000_001.7
+
+    assert orjson.loads(formatter.format(first))["timestamp"] == "20"
+    assert orjson.loads(formatter.format(first))["timestamp"] == "20"
+    assert orjson.loads(formatter.format(second))["timestamp"] == "21"
+
+
+def test_setup_logging_accepts_critical() -> None:
+    """Test that every documented level name, including critical, is accepted."""
+    logger = logging.getLogger("dedalus-proxy")
+    saved_level, saved_handlers = logger.level, logger.handlers[:]
+    try:
+        assert setup_logging("CRITICAL").level == logging.CRITICAL
+        assert setup_logging("critical").handlers[0].level == logging.CRITICAL
+    finally:
+        logger.setLevel(saved_level)
+        logger.handlers[:] = saved_handlers
+
+
+def test_setup_logging_rejects_unknown_level() -> None:
+    """Test that an unknown level raises a ValueError naming the valid ones."""
+    with pytest.raises(ValueError, match="debug, info, warning, error, critical"):
+        setup_logging("verbose")
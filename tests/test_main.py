@@ -0,0 +1,60 @@
+"""Tests for the application lifespan."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from dedalus_labs_proxy import config, main
+from dedalus_labs_proxy.main import app
+from dedalus_labs_proxy.services.dedalus import DedalusClient
+
+
+@pytest.fixture
+def lifespan_client(monkeypatch: pytest.MonkeyPatch) -> DedalusClient:
+    """Give the app lifespan a fresh client manager instead of the global one."""
+    manager = DedalusClient()
+    monkeypatch.setattr(main, "global_client", manager)
+    return manager
+
+
+async def test_lifespan_starts_and_closes_client(
+    lifespan_client: DedalusClient,
+) -> None:
+    """Test that the client is built at startup and released at shutdown."""
+    async with app.router.lifespan_context(app):
+        assert lifespan_client._runner is not None
+        assert lifespan_client._client is not None
+
+    assert lifespan_client._runner is None
+    assert lifespan_client._client is None
+
+
+async def test_lifespan_closes_client_when_cancelled(
+    lifespan_client: DedalusClient,
+) -> None:
+    """Test that the client is closed even if the app exits by cancellation."""
+    sdk_client = MagicMock(close=AsyncMock())
+    lifespan_client._client = sdk_client
+
+    with pytest.raises(asyncio.CancelledError):
+        async with app.router.lifespan_context(app):
+            raise asyncio.CancelledError
+
+    sdk_client.close.assert_awaited_once()
+    assert lifespan_client._client is None
+
+
+async def test_lifespan_exits_without_api_key(
+    lifespan_client: DedalusClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that startup exits when DEDALUS_API_KEY is missing."""
+    monkeypatch.delenv("DEDALUS_API_KEY")
+    monkeypatch.setattr(config, "_config", None)
+
+    with pytest.raises(SystemExit) as exc_info:
+        async with app.router.lifespan_context(app):
+            pass
+
+    assert exc_info.value.code == 1
+    assert lifespan_client._client is None
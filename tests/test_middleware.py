@@ -0,0 +1,52 @@
+"""Tests for CORS middleware."""
+
+from httpx import AsyncClient
+
+
+async def test_cors_simple_request_with_origin(async_client: AsyncClient) -> None:
+    """Test that cross-origin requests get a wildcard allow-origin header."""
+    response = await async_client.get(
+        "/health", headers={"Origin": "http://example.com"}
+    )
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "*"
+    assert response.headers["vary"] == "Origin"
+
+
+async def test_cors_simple_request_without_origin(async_client: AsyncClient) -> None:
+    """Test that same-origin requests don't get an allow-origin header."""
+    response = await async_client.get("/health")
+    assert response.status_code == 200
+    assert "access-control-allow-origin" not in response.headers
+
+
+async def test_cors_preflight(async_client: AsyncClient) -> None:
+    """Test that preflight requests are answered with the allowed headers."""
+    response = await async_client.options(
+        "/v1/chat/completions",
+        headers={
+            "Origin": "http://example.com",
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "authorization, content-type",
+        },
+    )
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "*"
+    assert "POST" in response.headers["access-control-allow-methods"]
+    assert (
+        response.headers["access-control-allow-headers"]
+        == "authorization, content-type"
+    )
+    assert response.headers["access-control-max-age"] == "600"
+
+
+async def test_cors_preflight_disallowed_method(async_client: AsyncClient) -> None:
+    """Test that preflight requests for unknown methods are rejected."""
+    response = await async_client.options(
+        "/v1/chat/completions",
+        headers={
+            "Origin": "http://example.com",
+            "Access-Control-Request-Method": "TRACE",
+        },
+    )
+    assert response.status_code == 400
@@ -1,28 +1,9 @@
 """Tests for models endpoint."""
 
-import os
-from collections.abc import AsyncGenerator
+import orjson
+from httpx import AsyncClient
 
-import pytest
-import pytest_asyncio
-from httpx import ASGITransport, AsyncClient
 
-# Set API key before importing app
-os.environ["DEDALUS_API_KEY"] = "test-api-key"
-
-from dedalus_labs_proxy.main import app
-
-
-@pytest_asyncio.fixture
-async def async_client() -> AsyncGenerator[AsyncClient, None]:
-    """Create an async HTTP client for testing."""
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://test"
-    ) as client:
-        yield client
-
-
-@pytest.mark.asyncio
 async def test_models_endpoint(async_client: AsyncClient) -> None:
     """Test the /v1/models endpoint returns empty list.
 
@@ -32,7 +13,4 @@ async def test_models_endpoint(async_client: AsyncClient) -> None:
     response = await async_client.get("/v1/models")
     assert response.status_code == 200
 
-    data = response.json()
-    assert data["object"] == "list"
-    assert "data" in data
-    assert len(data["data"]) == 0
+    assert orjson.loads(response.content) == {"object": "list", "data": []}
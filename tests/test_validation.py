@@ -1,107 +1,68 @@
 """Tests for validation error handling."""
 
-import os
-from collections.abc import AsyncGenerator
+from typing import Any
 
+import orjson
 import pytest
-import pytest_asyncio
-from httpx import ASGITransport, AsyncClient
+from httpx import AsyncClient
+from pydantic import ValidationError
 
-# Set API key before importing app
-os.environ["DEDALUS_API_KEY"] = "test-api-key"
+from dedalus_labs_proxy.models import ChatCompletionRequest
 
-from dedalus_labs_proxy.main import app
 
-
-@pytest_asyncio.fixture
-async def async_client() -> AsyncGenerator[AsyncClient, None]:
-    """Create an async HTTP client for testing."""
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://test"
-    ) as client:
-        yield client
-
-
-@pytest.mark.asyncio
-async def test_validation_error_missing_model(async_client: AsyncClient) -> None:
-    """Test validation error for missing model field."""
+async def test_validation_error_response_format(async_client: AsyncClient) -> None:
+    """Test that validation errors are returned as a 422 error envelope."""
     payload = {
         "messages": [{"role": "user", "content": "Hello"}],
     }
     response = await async_client.post("/v1/chat/completions", json=payload)
     assert response.status_code == 422
 
-    data = response.json()
+    data = orjson.loads(response.content)
     assert "error" in data
     assert data["error"]["type"] == "validation_error"
     assert "details" in data["error"]
 
 
-@pytest.mark.asyncio
-async def test_validation_error_missing_messages(async_client: AsyncClient) -> None:
-    """Test validation error for missing messages field."""
-    payload = {
-        "model": "gpt-4",
-    }
-    response = await async_client.post("/v1/chat/completions", json=payload)
-    assert response.status_code == 422
-
-    data = response.json()
-    assert "error" in data
-    assert data["error"]["type"] == "validation_error"
-
-
-@pytest.mark.asyncio
-async def test_validation_error_invalid_messages_format(
-    async_client: AsyncClient,
-) -> None:
-    """Test validation error for invalid messages format."""
-    payload = {
-        "model": "gpt-4",
-        "messages": "not an array",  # Should be an array
-    }
-    response = await async_client.post("/v1/chat/completions", json=payload)
-    assert response.status_code == 422
-
-    data = response.json()
-    assert "error" in data
-    assert data["error"]["type"] == "validation_error"
-
-
-@pytest.mark.asyncio
-async def test_validation_error_empty_messages(async_client: AsyncClient) -> None:
-    """Test validation error for empty messages array."""
+@pytest.mark.parametrize(
+    "payload",
+    [
+        pytest.param(
+            {"messages": [{"role": "user", "content": "Hello"}]},
+            id="missing_model",
+        ),
+        pytest.param({"model": "gpt-4"}, id="missing_messages"),
+        pytest.param(
+            {"model": "gpt-4", "messages": "not an array"},
+            id="invalid_messages_format",
+        ),
+        pytest.param(
+            {"model": "gpt-4", "messages": [{"content": "Hello"}]},
+            id="missing_role_in_message",
+        ),
+        pytest.param(
+            {
+                "model": "gpt-4",
+                "messages": [{"role": "user", "content": "Hello"}],
+                "temperature": "hot",
+            },
+            id="invalid_temperature",
+        ),
+    ],
+)
+def test_validation_error(payload: dict[str, Any]) -> None:
+    """Test that malformed chat completion requests are rejected."""
+    with pytest.raises(ValidationError):
+        ChatCompletionRequest.model_validate(payload)
+
+
+def test_validation_empty_messages_is_valid() -> None:
+    """Test that an empty messages array passes request validation."""
     payload = {
         "model": "gpt-4",
         "messages": [],
     }
-    # Empty messages is technically valid per the schema
-    # The behavior depends on implementation - may hit real API
-    response = await async_client.post("/v1/chat/completions", json=payload)
-    # 200 with mocked client, 400/422 for validation, 401 if hitting real API
-    assert response.status_code in [200, 400, 401, 422]
-
-
-@pytest.mark.asyncio
-async def test_validation_error_missing_role_in_message(
-    async_client: AsyncClient,
-) -> None:
-    """Test validation error for message without role."""
-    payload = {
-        "model": "gpt-4",
-        "messages": [{"content": "Hello"}],  # Missing role
-    }
-    response = await async_client.post("/v1/chat/completions", json=payload)
-    assert response.status_code == 422
-
-
-@pytest.mark.asyncio
-async def test_validation_error_invalid_temperature(async_client: AsyncClient) -> None:
-    """Test validation error for invalid temperature type."""
-    payload = {
-        "model": "gpt-4",
-        "messages": [{"role": "user", "content": "Hello"}],
-        "temperature": "hot",  # Should be a number
-    }
-    response = await async_client.post("/v1/chat/completions", json=payload)
-    assert response.status_code == 422
+    # Empty messages is technically valid per the schema; rejecting it is
+    # left to the upstream API
+    request = ChatCompletionRequest.model_validate(payload)
+    assert request.messages == []